@@ -2,9 +2,26 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.express as px
+import plotly.graph_objects as go
 from pathlib import Path
 from datetime import datetime
-import textwrap
+from functools import partial
+from time import perf_counter
+
+from data_layer import (
+    INFERRED_TOPIC_COL, ROLLUP_FREQS, content_digest, cube_counts, cube_kpis, cube_priority, cube_slice,
+    exemplar_rows, fetch_text, get_export_cache, iter_upload_chunks, iter_view_chunks, load_exemplar_index,
+    load_live_dataset, load_upload, merge_label_map, page_positions, rows_with_text,
+    split_text, start_data_watcher,
+)
+from search_index import filter_hits, live_search_index, load_search_index
+from timeseries import (
+    TS_DATE_COL, downsample, load_forecast, load_monthly_series, load_scenario_summary, range_slice,
+)
+from topic_inference import UNASSIGNED_TOPIC, load_topic_inference
+from text_matrix import load_topic_overlap, load_topic_top_words
+from exports import FULL_EXPORT_FORMATS, available_formats, export_key, get_export_jobs, lazy_csv, xlsx_too_large
+from perf import Stopwatch, get_timing_ring, timed
 
 # ============================================================
 # 0) PAGE CONFIG
@@ -15,6 +32,8 @@ st.set_page_config(
     layout="wide",
     initial_sidebar_state="expanded",
 )
+# durasi tiap section per rerun -> ring buffer (panel admin di sidebar)
+rerun_watch = Stopwatch()
 
 ROOT = Path(__file__).parent
 DATA = ROOT / "data"
@@ -40,10 +59,38 @@ SUMMARY_COUNTS = DATA / "summary_counts.csv"
 # people analytics export
 NEG_ACTION = DATA / "neg_action.csv"
 
+# semua ulasan rating <= 2 (bahan People Analytics)
+LOW_RATING_REVIEWS = DATA / "rating_2kebawah_semua_ulasan.csv"
+
+# full topic exports (semua ulasan + topic) -> dipakai pencarian teks
+NEG_FULL = DATA / "hasil_topic_negatif_full.csv"
+POS_FULL = DATA / "hasil_topic_positif_full.csv"
+
+# deret waktu KB aktif + forecast skenario (halaman kebijakan)
+MONTHLY_CSV = DATA / "data_clean_monthly.csv"
+FORECAST_CSV = DATA / "forecast_kb_aktif_2025_skenario.csv"
+MODEL_METRICS = DATA / "model_summary_metrics.csv"
+
 # optional: recommended extra files (if you add later)
 TOPIC_LABEL_MAP = DATA / "topic_label_map.csv"   # recommended (manual labels/actions)
 RATING_COUNTS = DATA / "rating_counts.csv"       # recommended (rating distribution export)
 
+# urutan panel "Status File" di sidebar
+STATUS_FILES = [
+    DATASET_FINAL, SUMMARY_COUNTS, NEG_TOPICS, POS_TOPICS, NEG_SUPPORT, POS_SUPPORT,
+    NEG_EXEMPLARS, POS_EXEMPLARS, NEG_EVAL, POS_EVAL, NEG_ACTION, TOPIC_LABEL_MAP, RATING_COUNTS,
+]
+REQUIRED_FILES = {DATASET_FINAL, SUMMARY_COUNTS}
+# semua file yang dipantau watcher (Status File + file yang hanya dipakai tab tertentu)
+WATCH_FILES = STATUS_FILES + [NEG_FULL, POS_FULL, LOW_RATING_REVIEWS, MONTHLY_CSV, FORECAST_CSV, MODEL_METRICS]
+
+# sumber pencarian teks: label -> (file, kolom text, kolom topic)
+SEARCH_SOURCES = {
+    "dataset_final.csv": (DATASET_FINAL, "text", "topic_id"),
+    "hasil_topic_negatif_full.csv": (NEG_FULL, "review_text", "topic"),
+    "hasil_topic_positif_full.csv": (POS_FULL, "review_text", "topic"),
+}
+
 PX_TEMPLATE = "plotly_white"
 
 # ============================================================
@@ -224,10 +271,11 @@ def nice_number(x):
     except Exception:
         return str(x)
 
-def safe_read_csv(path: Path) -> pd.DataFrame | None:
+def safe_read_csv(path: Path, fingerprint: tuple | None) -> pd.DataFrame | None:
+    # hasil dibagi lintas session (ExportCache) -> jangan di-mutate, selalu .copy() dulu
     try:
-        if path.exists():
-            return pd.read_csv(path)
+        if fingerprint is not None:
+            return get_export_cache().get(path, fingerprint)
         return None
     except Exception as e:
         st.error(f"Gagal membaca {path.name}: {e}")
@@ -236,60 +284,111 @@ def safe_read_csv(path: Path) -> pd.DataFrame | None:
 def file_ok(p: Path) -> bool:
     return p.exists()
 
-def file_status_line(p: Path, required=False) -> str:
-    if p.exists():
-        ts = datetime.fromtimestamp(p.stat().st_mtime).strftime("%Y-%m-%d %H:%M:%S")
+def file_status_line(p: Path, fingerprint: tuple | None, required=False) -> str:
+    if fingerprint is not None:
+        ts = datetime.fromtimestamp(fingerprint[1] / 1e9).strftime("%Y-%m-%d %H:%M:%S")
         return f"✅ {p.name} (modified {ts})"
     return f"{'❌' if required else '⚠️'} {p.name} (tidak ditemukan)"
 
-def wrap_text(s: str, width=110) -> str:
-    return "\n".join(textwrap.wrap(str(s), width=width))
+def paged_table(key: str, df: pd.DataFrame, version: tuple, idx=None, texts: pd.Series | None = None,
+                page_sizes=(25, 50, 100)):
+    # tabel dipotong di server: yang dikirim ke browser hanya 1 halaman (ukuran payload konstan)
+    n = len(df) if idx is None else len(idx)
+    c1, c2, c3, c4 = st.columns([1.6, 1.0, 1.0, 1.0])
+    with c1:
+        sort_col = st.selectbox("Urutkan berdasarkan", ["(urutan asli)"] + list(df.columns), key=f"{key}_sort")
+    with c2:
+        ascending = st.toggle("Naik (A→Z)", value=True, key=f"{key}_asc")
+    with c3:
+        page_size = st.selectbox("Baris / halaman", page_sizes, key=f"{key}_size")
+    n_pages = max(1, -(-n // page_size))
+    with c4:
+        page = st.number_input(f"Halaman (dari {n_pages})", 1, n_pages, 1, step=1, key=f"{key}_page")
+
+    start = (min(page, n_pages) - 1) * page_size
+    rows = page_positions(
+        version, None if sort_col == "(urutan asli)" else sort_col, ascending, df, idx, start, start + page_size
+    )
+    out = df.iloc[rows] if texts is None else fetch_text(df.iloc[rows], texts)
+    st.dataframe(out, use_container_width=True)
+    st.caption(f"Baris {nice_number(min(start + 1, n))}–{nice_number(start + len(rows))} dari {nice_number(n)}")
+
+@st.cache_resource(show_spinner=False, max_entries=256)
+def cached_figure(key: tuple, _build):
+    # key = (nama chart, versi data, state filter ...) -> figure dipakai bersama semua session.
+    # st.plotly_chart hanya membaca figure, jadi aman dibagi (jangan di-update_layout setelahnya)
+    return _build()
+
+def show_figure(key: tuple, build):
+    # figure dari cache + serialisasi ke browser, dicatat sebagai "chart <nama>"
+    with timed(f"chart {key[0]}"):
+        st.plotly_chart(cached_figure(key, build), use_container_width=True)
+
+def bar_figure(df: pd.DataFrame, x: str, y: str, height: int, xaxis_title: str, yaxis_title: str):
+    fig = px.bar(df, x=x, y=y, template=PX_TEMPLATE)
+    fig.update_layout(height=height, xaxis_title=xaxis_title, yaxis_title=yaxis_title)
+    return fig
+
+def line_figure(df: pd.DataFrame, x: str, y: str, height: int, xaxis_title: str, yaxis_title: str,
+                color: str | None = None):
+    fig = px.line(df, x=x, y=y, color=color, markers=True, template=PX_TEMPLATE)
+    fig.update_layout(height=height, xaxis_title=xaxis_title, yaxis_title=yaxis_title)
+    return fig
+
+def scatter_figure(traces: list[dict], height: int, yaxis_title: str):
+    fig = go.Figure([go.Scatter(**t) for t in traces])
+    fig.update_layout(
+        height=height, template=PX_TEMPLATE, yaxis_title=yaxis_title,
+        margin=dict(l=10, r=10, t=10, b=10), legend=dict(orientation="h"),
+    )
+    return fig
+
+def history_figure(mview: pd.DataFrame, show_pus: bool):
+    # LTTB per seri: histori panjang tetap <= LTTB_MAX_POINTS titik per trace
+    cols = [("kb_aktif", "KB Aktif")] + ([("pus", "PUS")] if show_pus else [])
+    traces = []
+    for col, name in cols:
+        s = downsample(mview, col)
+        traces.append(dict(x=s[TS_DATE_COL], y=s[col], name=name, mode="lines"))
+    return scatter_figure(traces, 440, "Jumlah")
+
+def forecast_figure(forecast: pd.DataFrame, history: pd.DataFrame, skenario: str):
+    traces = []
+    if "kb_aktif" in history.columns:
+        h = downsample(history.tail(24), "kb_aktif")   # konteks: 2 tahun terakhir data aktual
+        traces.append(dict(x=h[TS_DATE_COL], y=h["kb_aktif"], name="Aktual (KB Aktif)", mode="lines"))
+    traces.append(dict(x=forecast[TS_DATE_COL], y=forecast[skenario], name=f"Forecast: {skenario}", mode="lines+markers"))
+    if {"CI_U", "CI_L"}.issubset(forecast.columns):
+        traces.append(dict(x=forecast[TS_DATE_COL], y=forecast["CI_U"], line=dict(width=0), showlegend=False, name="CI Upper"))
+        traces.append(dict(x=forecast[TS_DATE_COL], y=forecast["CI_L"], fill="tonexty", line=dict(width=0), name="Confidence Interval"))
+    return scatter_figure(traces, 440, "KB Aktif")
+
+def full_export_panel(key: str, ext: str, mime: str):
+    state, info = get_export_jobs().status(key, ext)
+    if state == "done":
+        st.download_button(
+            f"⬇️ Download dataset_full.{ext}",
+            data=partial(Path.open, info, "rb"),
+            file_name=f"dataset_full.{ext}",
+            mime=mime,
+            use_container_width=True
+        )
+    elif state == "error":
+        st.error(f"Export gagal: {info}")
+    else:
+        st.caption("Belum ada export lengkap untuk data, filter & format ini.")
+
+@st.fragment(run_every=2)
+def full_export_poll(key: str, ext: str):
+    # polling hanya selama job jalan; selesai -> satu rerun penuh lalu tampil tombol download
+    if get_export_jobs().status(key, ext)[0] != "running":
+        st.rerun()
+    st.info("⏳ Export lengkap sedang dibuat di background (halaman tetap bisa dipakai)...")
 
 # ============================================================
 # 4) CORE STANDARDIZATION (dataset_final)
 # ============================================================
-def coalesce_col(df: pd.DataFrame, candidates: list[str]) -> str | None:
-    for c in candidates:
-        if c in df.columns:
-            return c
-    return None
-
-def normalize_sentiment(x) -> str:
-    if pd.isna(x): return ""
-    s = str(x).strip().lower()
-    if s in {"positive","positif","pos"}: return "positif"
-    if s in {"negative","negatif","neg"}: return "negatif"
-    if s in {"neutral","netral","neu"}: return "netral"
-    return s
-
-def standardize_dataset(df: pd.DataFrame) -> tuple[pd.DataFrame, dict, str | None]:
-    sent_col  = coalesce_col(df, ["sentimen","sentiment","label_sentimen","label"])
-    topic_col = coalesce_col(df, ["topic_id","topic","topik","dominant_topic","dom_topic"])
-    rating_col= coalesce_col(df, ["rating","rate","score","bintang","stars"])
-    text_col  = coalesce_col(df, ["text","ulasan","review","komentar","steming_data"])
-
-    schema = {"sent_col": sent_col, "topic_col": topic_col, "rating_col": rating_col, "text_col": text_col}
-    if any(v is None for v in schema.values()):
-        miss = [k for k, v in schema.items() if v is None]
-        return df, schema, f"Kolom wajib tidak ditemukan: {', '.join(miss)}"
-
-    tmp = df.copy()
-    tmp[sent_col] = tmp[sent_col].apply(normalize_sentiment)
-    tmp[rating_col] = pd.to_numeric(tmp[rating_col], errors="coerce")
-    tmp[topic_col] = pd.to_numeric(tmp[topic_col], errors="coerce")
-    tmp = tmp.dropna(subset=[rating_col, topic_col]).copy()
-
-    out = pd.DataFrame({
-        "sentimen": tmp[sent_col].astype(str).str.lower().str.strip(),
-        "topic_id": tmp[topic_col].astype(int),
-        "rating": tmp[rating_col].astype(float),
-        "text": tmp[text_col].astype(str),
-    })
-    return out, schema, None
-
-@st.cache_data(show_spinner=False)
-def load_dataset_final(path: Path) -> pd.DataFrame:
-    return pd.read_csv(path)
+# logika standardisasi + cache ada di data_layer.py (shared lintas session)
 
 # ============================================================
 # 5) LOGIN PAGE
@@ -328,36 +427,46 @@ def login_page():
 if not st.session_state.logged_in:
     login_page()
     st.stop()
+rerun_watch.lap("0-5) config, auth, CSS")
 
 # ============================================================
 # 6) LOAD FILES (dataset_final + exports)
 # ============================================================
-if not DATASET_FINAL.exists():
+# manifest dari background watcher: file yang diganti di data/ otomatis dimuat ulang
+# (tanpa redeploy), lalu terlihat di rerun berikutnya
+file_fps = start_data_watcher(tuple(WATCH_FILES), DATASET_FINAL).manifest()
+
+if file_fps[DATASET_FINAL] is None:
     st.error("File wajib tidak ditemukan: data/dataset_final.csv")
     st.stop()
 
-df_raw = load_dataset_final(DATASET_FINAL)
-df_std, schema, err = standardize_dataset(df_raw)
-if err:
-    st.error(f"dataset_final.csv invalid: {err}")
-    st.info(f"Skema terdeteksi: {schema}")
+# dataset_final + delta harian di data/incoming/*.csv (append, dedup teks, tanpa restart)
+live = load_live_dataset(DATASET_FINAL, file_fps[DATASET_FINAL])
+if live.err:
+    st.error(f"dataset_final.csv invalid: {live.err}")
+    st.info(f"Skema terdeteksi: {live.schema}")
     st.stop()
+# cube = sentimen x rating x topic_id (KPI & distribusi); rollups = cube per periode (tren);
+# data_version = key cache/export
+df_std, texts_std, cube, rollups, data_version = live.state()
 
 # exports
-neg_topics = safe_read_csv(NEG_TOPICS)
-pos_topics = safe_read_csv(POS_TOPICS)
-neg_support = safe_read_csv(NEG_SUPPORT)
-pos_support = safe_read_csv(POS_SUPPORT)
-neg_ex = safe_read_csv(NEG_EXEMPLARS)
-pos_ex = safe_read_csv(POS_EXEMPLARS)
-neg_eval = safe_read_csv(NEG_EVAL)
-pos_eval = safe_read_csv(POS_EVAL)
-summary_counts = safe_read_csv(SUMMARY_COUNTS)
-neg_action = safe_read_csv(NEG_ACTION)
+neg_topics = safe_read_csv(NEG_TOPICS, file_fps[NEG_TOPICS])
+pos_topics = safe_read_csv(POS_TOPICS, file_fps[POS_TOPICS])
+neg_support = safe_read_csv(NEG_SUPPORT, file_fps[NEG_SUPPORT])
+pos_support = safe_read_csv(POS_SUPPORT, file_fps[POS_SUPPORT])
+neg_ex = safe_read_csv(NEG_EXEMPLARS, file_fps[NEG_EXEMPLARS])
+pos_ex = safe_read_csv(POS_EXEMPLARS, file_fps[POS_EXEMPLARS])
+neg_eval = safe_read_csv(NEG_EVAL, file_fps[NEG_EVAL])
+pos_eval = safe_read_csv(POS_EVAL, file_fps[POS_EVAL])
+summary_counts = safe_read_csv(SUMMARY_COUNTS, file_fps[SUMMARY_COUNTS])
+neg_action = safe_read_csv(NEG_ACTION, file_fps[NEG_ACTION])
 
 # optional
-topic_label_map = safe_read_csv(TOPIC_LABEL_MAP)
-rating_counts = safe_read_csv(RATING_COUNTS)
+topic_label_map = safe_read_csv(TOPIC_LABEL_MAP, file_fps[TOPIC_LABEL_MAP])
+rating_counts = safe_read_csv(RATING_COUNTS, file_fps[RATING_COUNTS])
+
+rerun_watch.lap("6) load files")
 
 # ============================================================
 # 7) SIDEBAR (logout + file status + global filters)
@@ -375,32 +484,29 @@ with st.sidebar:
 
     st.markdown('<div class="hr"></div>', unsafe_allow_html=True)
     st.markdown("### 📁 Status File (data/)")
-    st.write(file_status_line(DATASET_FINAL, required=True))
-    st.write(file_status_line(SUMMARY_COUNTS, required=True))
-    st.write(file_status_line(NEG_TOPICS))
-    st.write(file_status_line(POS_TOPICS))
-    st.write(file_status_line(NEG_SUPPORT))
-    st.write(file_status_line(POS_SUPPORT))
-    st.write(file_status_line(NEG_EXEMPLARS))
-    st.write(file_status_line(POS_EXEMPLARS))
-    st.write(file_status_line(NEG_EVAL))
-    st.write(file_status_line(POS_EVAL))
-    st.write(file_status_line(NEG_ACTION))
-    st.write(file_status_line(TOPIC_LABEL_MAP))
-    st.write(file_status_line(RATING_COUNTS))
+    for p in STATUS_FILES:
+        st.write(file_status_line(p, file_fps[p], required=p in REQUIRED_FILES))
+    inc = live.summary()
+    if inc["files"] or inc["rejected"]:
+        st.write(
+            f"📥 **incoming/**: {inc['files']} file • +{nice_number(inc['rows'])} ulasan "
+            f"• {nice_number(inc['dup_rows'])} duplikat dilewati"
+        )
+        for name, msg in inc["rejected"].items():
+            st.write(f"⚠️ incoming/{name} ditolak: {msg}")
 
     st.markdown('<div class="hr"></div>', unsafe_allow_html=True)
     st.markdown("### 🔎 Filter Global (opsional)")
-    rating_vals = sorted(df_std["rating"].dropna().unique().tolist())
-    sent_vals = sorted(df_std["sentimen"].dropna().unique().tolist())
+    rating_vals = sorted(cube["rating"].dropna().unique().tolist())
+    sent_vals = sorted(cube["sentimen"].dropna().unique().tolist())
     rating_filter = st.multiselect("Rating", rating_vals)
     sent_filter = st.multiselect("Sentimen", sent_vals)
 
-df_view = df_std.copy()
-if rating_filter:
-    df_view = df_view[df_view["rating"].isin(rating_filter)]
-if sent_filter:
-    df_view = df_view[df_view["sentimen"].isin(sent_filter)]
+# df_std tidak di-copy: filter = index posisi baris (cached per kombinasi filter, di-extend saat ada delta)
+view_filters = (tuple(sorted(rating_filter)), tuple(sorted(sent_filter)))
+view_idx = live.view_index(df_std, *view_filters)
+cube_view = cube_slice(cube, rating_filter, sent_filter)
+rerun_watch.lap("7) sidebar + filter")
 
 # ============================================================
 # 8) HERO + KPI
@@ -424,10 +530,11 @@ with c3:
     show_logo(LOGO_BKKBN, 175)
 st.markdown("</div>", unsafe_allow_html=True)
 
-total_data = int(len(df_view))
-avg_rating = float(df_view["rating"].mean()) if total_data else 0.0
-pos_pct = 100.0 * float((df_view["sentimen"] == "positif").mean()) if total_data else 0.0
-neg_pct = 100.0 * float((df_view["sentimen"] == "negatif").mean()) if total_data else 0.0
+kpi = cube_kpis(cube_view)
+total_data = kpi["total"]
+avg_rating = kpi["avg_rating"]
+pos_pct = kpi["pos_pct"]
+neg_pct = kpi["neg_pct"]
 
 st.markdown(
     f"""
@@ -440,22 +547,29 @@ st.markdown(
     """,
     unsafe_allow_html=True
 )
+rerun_watch.lap("8) hero + KPI")
 
 # ============================================================
 # 9) TABS
 # ============================================================
-tab1, tab2, tab3, tab4, tab5 = st.tabs([
+tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs([
     "📊 Overview",
     "🧩 Topic Modeling (Export)",
     "🧑‍💼 People Analytics (Prioritas & Aksi)",
     "🧪 Model Quality (Coherence/Perplexity)",
-    "🚀 Deployment (Upload & Export)"
-])
+    "🚀 Deployment (Upload & Export)",
+    "🔎 Cari Ulasan",
+    "⏳ Deret Waktu & Kebijakan",
+], key="main_tab", on_change="rerun")
+# Lazy: hanya tab yang sedang dibuka yang dieksekusi (lihat dispatch di akhir bagian 9).
+# Tiap tab adalah fragment -> interaksi widget di dalam tab hanya me-rerun tab itu saja.
 
 # ------------------------------------------------------------
 # TAB 1: OVERVIEW
 # ------------------------------------------------------------
-with tab1:
+@st.fragment
+@timed("9) tab Overview")
+def render_overview():
     card_open("Overview", "Ringkasan dataset + distribusi rating + distribusi sentimen.")
 
     # Sentiment counts: prefer summary_counts.csv if exists
@@ -464,12 +578,13 @@ with tab1:
         sc["sentimen"] = sc["sentimen"].astype(str).str.lower().str.strip()
         st.markdown("### Ringkasan jumlah ulasan per sentimen (export)")
         st.dataframe(sc, use_container_width=True)
-        fig_sc = px.bar(sc, x="sentimen", y="jumlah", template=PX_TEMPLATE)
-        fig_sc.update_layout(height=280, xaxis_title="Sentimen", yaxis_title="Jumlah")
-        st.plotly_chart(fig_sc, use_container_width=True)
+        show_figure(
+            ("summary_counts", file_fps[SUMMARY_COUNTS]),
+            partial(bar_figure, sc, "sentimen", "jumlah", 280, "Sentimen", "Jumlah"),
+        )
     else:
         st.warning("summary_counts.csv tidak tersedia / format tidak sesuai. Menghitung dari dataset_final.")
-        sc = df_std.groupby("sentimen").size().reset_index(name="jumlah").sort_values("jumlah", ascending=False)
+        sc = cube_counts(cube, "sentimen").sort_values("jumlah", ascending=False)
         st.dataframe(sc, use_container_width=True)
 
     st.markdown('<div class="hr"></div>', unsafe_allow_html=True)
@@ -481,23 +596,49 @@ with tab1:
         rc["rating"] = pd.to_numeric(rc["rating"], errors="coerce")
         rc["jumlah"] = pd.to_numeric(rc["jumlah"], errors="coerce")
         rc = rc.dropna().sort_values("rating")
+        rc_key = ("rating_counts", file_fps[RATING_COUNTS])
         st.caption("Sumber: rating_counts.csv (export, disarankan untuk konsistensi laporan)")
     else:
-        rc = df_view.groupby("rating").size().reset_index(name="jumlah").sort_values("rating")
+        rc = cube_counts(cube_view, "rating").sort_values("rating")
+        rc_key = ("rating_dist", data_version, view_filters)
         st.caption("Sumber: dataset_final.csv (computed)")
-    fig_rc = px.bar(rc, x="rating", y="jumlah", template=PX_TEMPLATE)
-    fig_rc.update_layout(height=320, xaxis_title="Rating", yaxis_title="Jumlah Ulasan")
-    st.plotly_chart(fig_rc, use_container_width=True)
+    show_figure(rc_key, partial(bar_figure, rc, "rating", "jumlah", 320, "Rating", "Jumlah Ulasan"))
+
+    st.markdown('<div class="hr"></div>', unsafe_allow_html=True)
+
+    # Trend: dari rollup per periode (ratusan baris), bukan scan ulasan
+    st.markdown("### Tren ulasan")
+    if not rollups:
+        st.info("dataset_final belum punya kolom tanggal (date / at / tanggal), jadi tren waktu belum tersedia.")
+    else:
+        c1, c2 = st.columns(2)
+        with c1:
+            freq = st.radio("Periode", list(ROLLUP_FREQS), index=2, format_func=ROLLUP_FREQS.get, horizontal=True)
+        with c2:
+            trend_by = st.selectbox("Pecah per", ["sentimen", "rating", "topic_id"])
+        roll_view = cube_slice(rollups[freq], rating_filter, sent_filter)
+        tr = cube_counts(roll_view, ["periode", trend_by]).sort_values("periode")
+        tr[trend_by] = tr[trend_by].astype(str)
+        show_figure(
+            ("trend", data_version, view_filters, freq, trend_by),
+            partial(line_figure, tr, "periode", "jumlah", 340, "Periode", "Jumlah Ulasan", trend_by),
+        )
+        st.caption(
+            f"Ulasan bertanggal: {nice_number(int(roll_view['n'].sum()))} dari {nice_number(int(cube_view['n'].sum()))} "
+            f"(terfilter) • {nice_number(len(tr))} titik data"
+        )
 
-    with st.expander("🔍 Preview dataset_final (validasi data terbaru)", expanded=False):
-        st.dataframe(df_view.head(60), use_container_width=True)
+    with st.expander("🔍 Jelajah dataset_final (validasi data terbaru, terfilter)", expanded=False):
+        paged_table("preview", df_std, (data_version, view_filters), idx=view_idx, texts=texts_std)
 
     card_close()
 
 # ------------------------------------------------------------
 # TAB 2: TOPIC MODELING (EXPORT-FIRST)
 # ------------------------------------------------------------
-with tab2:
+@st.fragment
+@timed("9) tab Topic Modeling")
+def render_topic_modeling():
     card_open(
         "Topic Modeling (Export)",
         "Menampilkan topik POSITIF vs NEGATIF dari file export kamu (tidak menghitung ulang LDA di Streamlit)."
@@ -511,7 +652,7 @@ with tab2:
         if neg_topics is None or neg_topics.empty:
             st.error("neg_topics.csv tidak ditemukan / kosong.")
         else:
-            st.dataframe(neg_topics, use_container_width=True)
+            paged_table("neg_topics", neg_topics, (file_fps[NEG_TOPICS],))
             if "topic" in neg_topics.columns:
                 # Try to join with support if available
                 if neg_support is not None and not neg_support.empty and "topic" in neg_support.columns:
@@ -521,13 +662,14 @@ with tab2:
 
                 # Visual: valid_docs if exists, else just show nothing
                 if "valid_docs" in join.columns:
-                    fig = px.bar(join.sort_values("valid_docs", ascending=False), x="topic", y="valid_docs", template=PX_TEMPLATE)
-                    fig.update_layout(height=280, xaxis_title="Topic", yaxis_title="Valid Docs")
-                    st.plotly_chart(fig, use_container_width=True)
+                    show_figure(
+                        ("neg_valid_docs", file_fps[NEG_TOPICS], file_fps[NEG_SUPPORT]),
+                        lambda: bar_figure(join.sort_values("valid_docs", ascending=False), "topic", "valid_docs", 280, "Topic", "Valid Docs"),
+                    )
 
             st.download_button(
                 "⬇️ Download neg_topics.csv",
-                data=neg_topics.to_csv(index=False).encode("utf-8"),
+                data=lazy_csv(("neg_topics", file_fps[NEG_TOPICS]), neg_topics),
                 file_name="neg_topics.csv",
                 mime="text/csv",
                 use_container_width=True
@@ -539,7 +681,7 @@ with tab2:
         if pos_topics is None or pos_topics.empty:
             st.error("pos_topics.csv tidak ditemukan / kosong.")
         else:
-            st.dataframe(pos_topics, use_container_width=True)
+            paged_table("pos_topics", pos_topics, (file_fps[POS_TOPICS],))
             if "topic" in pos_topics.columns:
                 if pos_support is not None and not pos_support.empty and "topic" in pos_support.columns:
                     join = pos_topics.merge(pos_support, on="topic", how="left")
@@ -547,13 +689,14 @@ with tab2:
                     join = pos_topics.copy()
 
                 if "valid_docs" in join.columns:
-                    fig = px.bar(join.sort_values("valid_docs", ascending=False), x="topic", y="valid_docs", template=PX_TEMPLATE)
-                    fig.update_layout(height=280, xaxis_title="Topic", yaxis_title="Valid Docs")
-                    st.plotly_chart(fig, use_container_width=True)
+                    show_figure(
+                        ("pos_valid_docs", file_fps[POS_TOPICS], file_fps[POS_SUPPORT]),
+                        lambda: bar_figure(join.sort_values("valid_docs", ascending=False), "topic", "valid_docs", 280, "Topic", "Valid Docs"),
+                    )
 
             st.download_button(
                 "⬇️ Download pos_topics.csv",
-                data=pos_topics.to_csv(index=False).encode("utf-8"),
+                data=lazy_csv(("pos_topics", file_fps[POS_TOPICS]), pos_topics),
                 file_name="pos_topics.csv",
                 mime="text/csv",
                 use_container_width=True
@@ -561,14 +704,43 @@ with tab2:
 
     st.markdown('<div class="hr"></div>', unsafe_allow_html=True)
 
+    # Top words & overlap dihitung ulang dari document-term matrix (ikut filter sidebar)
+    st.markdown("### Kata Kunci Live (dataset_final, ikut filter)")
+    kw_sent = st.radio("Pilih sentimen kata kunci", ["negatif", "positif"], horizontal=True)
+    kw_export, kw_fp = (neg_topics, file_fps[NEG_TOPICS]) if kw_sent == "negatif" else (pos_topics, file_fps[POS_TOPICS])
+    kw_version = (data_version, view_filters)
+    live_words = load_topic_top_words(kw_version, kw_sent, live, df_std, view_idx)
+    if live_words.empty:
+        st.info("Tidak ada ulasan dengan sentimen ini pada filter sekarang.")
+    else:
+        kw = load_topic_overlap(
+            kw_version, kw_sent, live, df_std, view_idx, tuple(live_words.items())
+        ).rename(columns={"mean_overlap_topwords": "overlap_live", "pct_with_topword": "pct_live"})
+        kw.insert(1, "top_words_live", kw["topic"].map(live_words))
+        if kw_export is not None and {"topic", "top_words"}.issubset(kw_export.columns):
+            export_words = kw_export.assign(topic=pd.to_numeric(kw_export["topic"], errors="coerce")).dropna(subset=["topic"])
+            export_words = export_words.set_index(export_words["topic"].astype(int))["top_words"].astype(str)
+            ov_export = load_topic_overlap(
+                (*kw_version, kw_fp), kw_sent, live, df_std, view_idx, tuple(export_words.items())
+            )
+            kw["top_words_export"] = kw["topic"].map(export_words)
+            kw["overlap_export"] = kw["topic"].map(ov_export.set_index("topic")["mean_overlap_topwords"])
+        st.caption(
+            "overlap = rata-rata jumlah top words topic yang muncul di ulasan (seperti overlap_topwords di exemplars); "
+            "pct_live = % ulasan yang memuat ≥ 1 top word live."
+        )
+        paged_table("kw_live", kw, (kw_version, kw_sent, kw_fp))
+
+    st.markdown('<div class="hr"></div>', unsafe_allow_html=True)
+
     # Exemplars viewer (important for academic validity)
     st.markdown("### Bukti: Contoh Ulasan yang Mewakili Topik (Exemplars)")
     sent_choice = st.radio("Pilih sentimen exemplars", ["negatif", "positif"], horizontal=True)
 
     if sent_choice == "negatif":
-        ex_df = neg_ex
+        ex_df, ex_fp = neg_ex, file_fps[NEG_EXEMPLARS]
     else:
-        ex_df = pos_ex
+        ex_df, ex_fp = pos_ex, file_fps[POS_EXEMPLARS]
 
     if ex_df is None or ex_df.empty:
         st.warning("File exemplars tidak ada / kosong.")
@@ -578,23 +750,17 @@ with tab2:
         if not need.issubset(set(ex_df.columns)):
             st.error(f"Format exemplars tidak sesuai. Kolom minimal: {need}")
         else:
-            topics = sorted(ex_df["topic"].dropna().unique().tolist())
+            ex_index = load_exemplar_index(ex_fp, ex_df)   # cached: urut dom_prob + text sudah di-wrap
+            topics = list(ex_index[2])
             pick_topic = st.selectbox("Pilih topic", topics, index=0)
             n_show = st.slider("Jumlah contoh ditampilkan", 3, 20, 8, step=1)
 
-            sub = ex_df[ex_df["topic"] == pick_topic].copy()
-            sub = sub.head(n_show).copy()
-
-            sub_disp = sub.copy()
-            sub_disp["text"] = sub_disp["text"].apply(lambda s: wrap_text(s, 115))
-            st.dataframe(sub_disp[["topic", "rating", "dom_prob", "overlap_topwords", "text"]]
-                         if set(["dom_prob", "overlap_topwords"]).issubset(sub_disp.columns)
-                         else sub_disp[["topic", "rating", "text"]],
-                         use_container_width=True)
+            sub, sub_disp = exemplar_rows(ex_index, pick_topic, n_show)
+            st.dataframe(sub_disp, use_container_width=True)
 
             st.download_button(
                 "⬇️ Download exemplars (filtered)",
-                data=sub.to_csv(index=False).encode("utf-8"),
+                data=lazy_csv(("exemplars", sent_choice, ex_fp, pick_topic, n_show), sub),
                 file_name=f"{sent_choice}_exemplars_topic_{pick_topic}.csv",
                 mime="text/csv",
                 use_container_width=True
@@ -605,21 +771,42 @@ with tab2:
 # ------------------------------------------------------------
 # TAB 3: PEOPLE ANALYTICS (NEGATIVE PRIORITY + ACTIONS + LABEL BUILDER)
 # ------------------------------------------------------------
-with tab3:
+@st.fragment
+@timed("9) tab People Analytics")
+def render_people_analytics():
     card_open(
         "People Analytics",
         "Mengubah insight topik menjadi prioritas perbaikan (frequency × impact) + rekomendasi aksi + bukti exemplars. "
         "Ini inti konversi mata kuliah People Analytics."
     )
 
-    # People Analytics is strongest for NEGATIVE (you provided neg_action.csv)
-    st.markdown("### A) Prioritas Masalah (NEGATIF) — dari neg_action.csv")
-    if neg_action is None or neg_action.empty:
-        st.error("neg_action.csv tidak ditemukan / kosong. Tab People Analytics butuh file ini.")
-        card_close()
+    # People Analytics is strongest for NEGATIVE
+    st.markdown("### A) Prioritas Masalah (NEGATIF)")
+    sources = ["Live (dataset_final, ikut filter)"]
+    if neg_action is not None and not neg_action.empty:
+        sources.append("Export neg_action.csv")
+    pa_source = st.radio("Sumber tabel prioritas", sources, horizontal=True)
+
+    if pa_source == sources[0]:
+        # dihitung dari cube terfilter (1 groupby di cube kecil) + top words dari token-count matrix
+        na = cube_priority(cube_view)
+        na["top_words"] = na["topic"].map(
+            load_topic_top_words((data_version, view_filters), "negatif", live, df_std, view_idx)
+        )
+        pa_version = (data_version, view_filters, file_fps[TOPIC_LABEL_MAP])
+        st.caption(
+            "P1 = frequency ≥ median & mean rating ≤ median, P2 = salah satu, P3 = tidak keduanya "
+            "(median antar topik pada data terfilter)."
+        )
     else:
-        # Normalize column names if needed
         na = neg_action.copy()
+        pa_version = (file_fps[NEG_ACTION], file_fps[TOPIC_LABEL_MAP])
+
+    # hanya bagian A yang bergantung pada tabel prioritas; B-E selalu tampil
+    if na.empty:
+        st.warning("Tidak ada ulasan negatif pada filter ini.")
+    else:
+        # Normalize column names if needed
 
         # dom_topic -> topic for consistency
         if "dom_topic" in na.columns and "topic" not in na.columns:
@@ -628,33 +815,23 @@ with tab3:
         # Validate required cols
         required_cols = {"topic", "priority", "frequency", "mean_rating", "median_rating", "top_words"}
         if not required_cols.issubset(set(na.columns)):
-            st.error(f"neg_action.csv kolom tidak lengkap. Butuh: {required_cols}")
-            card_close()
+            st.error(f"Tabel prioritas kolom tidak lengkap. Butuh: {required_cols}")
         else:
             # Optional: merge label map
-            label_map = topic_label_map.copy() if (topic_label_map is not None and not topic_label_map.empty) else pd.DataFrame()
+            label_map = topic_label_map if (topic_label_map is not None and not topic_label_map.empty) else pd.DataFrame()
             if not label_map.empty:
-                # expecting: sentimen, topic_id, label, action
-                # your topics are numeric; map topic->topic_id
-                if set(["sentimen","topic_id","label","action"]).issubset(label_map.columns):
-                    lm = label_map.copy()
-                    lm["sentimen"] = lm["sentimen"].astype(str).str.lower().str.strip()
-                    lm["topic_id"] = pd.to_numeric(lm["topic_id"], errors="coerce")
-                    lm = lm.dropna(subset=["topic_id"]).copy()
-                    lm["topic_id"] = lm["topic_id"].astype(int)
-                    # topic in na might already be int
-                    na["topic"] = pd.to_numeric(na["topic"], errors="coerce")
-                    na = na.dropna(subset=["topic"]).copy()
-                    na["topic"] = na["topic"].astype(int)
-                    lm_neg = lm[lm["sentimen"] == "negatif"].copy()
-                    na = na.merge(lm_neg, left_on="topic", right_on="topic_id", how="left").drop(columns=["topic_id"])
+                # expecting: sentimen, topic_id, label, action (topic numerik -> topic_id)
+                merged = merge_label_map(na, label_map, "negatif")
+                if merged is not None:
+                    na = merged
                 else:
                     st.warning("topic_label_map.csv ada, tapi format kolom tidak sesuai (butuh sentimen,topic_id,label,action).")
 
             # Filters
             c1, c2, c3 = st.columns([1.0, 1.0, 1.5], gap="large")
             with c1:
-                min_freq = st.slider("Min frequency", 1, int(na["frequency"].max()), 20)
+                max_freq = int(na["frequency"].max())
+                min_freq = st.slider("Min frequency", 1, max(max_freq, 2), min(20, max_freq))
             with c2:
                 show_only_p1 = st.checkbox("Tampilkan hanya P1", value=False)
             with c3:
@@ -669,122 +846,141 @@ with tab3:
             if "label" in na_f.columns: cols_show.insert(1, "label")
             if "action" in na_f.columns: cols_show.append("action")
 
-            st.dataframe(na_f[cols_show].sort_values(["priority", "frequency"], ascending=[True, False]), use_container_width=True)
+            paged_table(
+                "priority",
+                na_f[cols_show].sort_values(["priority", "frequency"], ascending=[True, False]),
+                (*pa_version, min_freq, show_only_p1),
+            )
 
             # Priority matrix scatter (frequency vs mean_rating)
-            fig = px.scatter(
-                na_f,
-                x="frequency",
-                y="mean_rating",
-                color="priority",
-                hover_data=["topic"],
-                template=PX_TEMPLATE,
+            def priority_scatter():
+                fig = px.scatter(
+                    na_f,
+                    x="frequency",
+                    y="mean_rating",
+                    color="priority",
+                    hover_data=["topic"],
+                    template=PX_TEMPLATE,
+                )
+                fig.update_layout(height=420, xaxis_title="Frequency", yaxis_title="Mean Rating (Impact)")
+                return fig
+            show_figure(
+                ("priority_scatter", *pa_version, min_freq, show_only_p1),
+                priority_scatter,
             )
-            fig.update_layout(height=420, xaxis_title="Frequency", yaxis_title="Mean Rating (Impact)")
-            st.plotly_chart(fig, use_container_width=True)
 
-            st.markdown('<div class="hr"></div>', unsafe_allow_html=True)
+    st.markdown('<div class="hr"></div>', unsafe_allow_html=True)
 
-            # Exemplars integrated with people analytics
-            st.markdown("### B) Bukti: Exemplars untuk Topik Negatif")
-            if neg_ex is None or neg_ex.empty:
-                st.warning("neg_exemplars.csv tidak tersedia. Exemplars sangat disarankan untuk presentasi.")
-            else:
-                topics = sorted(neg_ex["topic"].dropna().unique().tolist())
-                pick_topic = st.selectbox("Pilih topic untuk exemplars (negatif)", topics, index=0)
-                n_show = st.slider("Jumlah exemplars", 3, 20, 8, step=1, key="pa_ex_n")
-
-                sub = neg_ex[neg_ex["topic"] == pick_topic].head(n_show).copy()
-                sub_disp = sub.copy()
-                sub_disp["text"] = sub_disp["text"].apply(lambda s: wrap_text(s, 115))
-                st.dataframe(sub_disp[["topic", "rating", "dom_prob", "overlap_topwords", "text"]]
-                             if set(["dom_prob","overlap_topwords"]).issubset(sub_disp.columns)
-                             else sub_disp[["topic","rating","text"]],
-                             use_container_width=True)
-
-            st.markdown('<div class="hr"></div>', unsafe_allow_html=True)
-
-            # POSITIVE "people analytics" (what to maintain) - derive from pos exemplars count or dataset
-            st.markdown("### C) People Analytics (POSITIVE) — Hal yang Dipertahankan")
-            st.caption("Kamu belum punya pos_action.csv. Untuk tetap kuat secara akademik, kita buat ringkasan positif dari frekuensi exemplars/topik atau dataset.")
-
-            if pos_ex is not None and not pos_ex.empty and "topic" in pos_ex.columns:
-                pos_freq = pos_ex.groupby("topic").size().reset_index(name="frequency_exemplars").sort_values("frequency_exemplars", ascending=False)
-                st.success("✅ Ringkasan positif dibuat dari pos_exemplars.csv (frekuensi contoh per topik).")
-            else:
-                # fallback from dataset_final
-                pos_freq = df_view[df_view["sentimen"] == "positif"].groupby("topic_id").size().reset_index(name="frequency").rename(columns={"topic_id":"topic"})
-                st.warning("⚠️ pos_exemplars.csv tidak tersedia, ringkasan positif dihitung dari dataset_final (fallback).")
+    # Exemplars integrated with people analytics
+    st.markdown("### B) Bukti: Exemplars untuk Topik Negatif")
+    if neg_ex is None or neg_ex.empty:
+        st.warning("neg_exemplars.csv tidak tersedia. Exemplars sangat disarankan untuk presentasi.")
+    else:
+        ex_index = load_exemplar_index(file_fps[NEG_EXEMPLARS], neg_ex)
+        topics = list(ex_index[2])
+        pick_topic = st.selectbox("Pilih topic untuk exemplars (negatif)", topics, index=0)
+        n_show = st.slider("Jumlah exemplars", 3, 20, 8, step=1, key="pa_ex_n")
 
-            # Join with pos_topics keywords if possible
-            if pos_topics is not None and not pos_topics.empty and set(["topic","top_words"]).issubset(pos_topics.columns):
-                pos_freq = pos_freq.merge(pos_topics, on="topic", how="left")
+        _, sub_disp = exemplar_rows(ex_index, pick_topic, n_show)
+        st.dataframe(sub_disp, use_container_width=True)
 
-            st.dataframe(pos_freq.head(15), use_container_width=True)
+    st.markdown('<div class="hr"></div>', unsafe_allow_html=True)
 
-            st.markdown('<div class="hr"></div>', unsafe_allow_html=True)
+    # POSITIVE "people analytics" (what to maintain) - derive from pos exemplars count or dataset
+    st.markdown("### C) People Analytics (POSITIVE) — Hal yang Dipertahankan")
+    st.caption("Kamu belum punya pos_action.csv. Untuk tetap kuat secara akademik, kita buat ringkasan positif dari frekuensi exemplars/topik atau dataset.")
 
-            # Recommended: Label & Action Builder (in-app) -> download topic_label_map.csv
-            st.markdown("### D) (Saran yang aku lakukan) Label & Action Builder (untuk laporan & dashboard)")
-            st.caption(
-                "Kamu butuh label topik + rekomendasi aksi yang manusiawi. Kalau topic_label_map.csv belum ada, "
-                "kamu bisa buat di sini lalu download CSV."
-            )
+    if pos_ex is not None and not pos_ex.empty and "topic" in pos_ex.columns:
+        pos_freq = pos_ex.groupby("topic").size().reset_index(name="frequency_exemplars").sort_values("frequency_exemplars", ascending=False)
+        st.success("✅ Ringkasan positif dibuat dari pos_exemplars.csv (frekuensi contoh per topik).")
+    else:
+        # fallback from dataset_final
+        pos_freq = cube_counts(cube_view[cube_view["sentimen"] == "positif"], "topic_id").rename(columns={"topic_id":"topic", "jumlah":"frequency"})
+        st.warning("⚠️ pos_exemplars.csv tidak tersedia, ringkasan positif dihitung dari dataset_final (fallback).")
 
-            # Build base template from available topics
-            neg_topic_ids = sorted(pd.to_numeric(na["topic"], errors="coerce").dropna().astype(int).unique().tolist())
-            pos_topic_ids = []
-            if pos_topics is not None and "topic" in pos_topics.columns:
-                pos_topic_ids = sorted(pd.to_numeric(pos_topics["topic"], errors="coerce").dropna().astype(int).unique().tolist())
-
-            template_rows = []
-            for t in neg_topic_ids:
-                template_rows.append({"sentimen":"negatif", "topic_id":t, "label":"", "action":""})
-            for t in pos_topic_ids:
-                template_rows.append({"sentimen":"positif", "topic_id":t, "label":"", "action":""})
-
-            template_df = pd.DataFrame(template_rows)
-
-            if topic_label_map is not None and not topic_label_map.empty and set(["sentimen","topic_id","label","action"]).issubset(topic_label_map.columns):
-                base = topic_label_map.copy()
-                base["sentimen"] = base["sentimen"].astype(str).str.lower().str.strip()
-                base["topic_id"] = pd.to_numeric(base["topic_id"], errors="coerce")
-                base = base.dropna(subset=["topic_id"]).copy()
-                base["topic_id"] = base["topic_id"].astype(int)
-                # merge to preserve your previous edits
-                template_df = template_df.merge(base, on=["sentimen","topic_id"], how="left", suffixes=("", "_old"))
-                # if existing values exist, prefer them
-                for col in ["label","action"]:
-                    if f"{col}_old" in template_df.columns:
-                        template_df[col] = template_df[f"{col}_old"].fillna(template_df[col])
-                        template_df = template_df.drop(columns=[f"{col}_old"])
-
-            edited = st.data_editor(
-                template_df,
-                use_container_width=True,
-                num_rows="dynamic",
-                hide_index=True
-            )
+    # Join with pos_topics keywords if possible
+    if pos_topics is not None and not pos_topics.empty and set(["topic","top_words"]).issubset(pos_topics.columns):
+        pos_freq = pos_freq.merge(pos_topics, on="topic", how="left")
 
-            st.download_button(
-                "⬇️ Download topic_label_map.csv (hasil edit)",
-                data=edited.to_csv(index=False).encode("utf-8"),
-                file_name="topic_label_map.csv",
-                mime="text/csv",
-                use_container_width=True
-            )
+    st.dataframe(pos_freq.head(15), use_container_width=True)
 
-            st.info(
-                "Cara pakai: download topic_label_map.csv → taruh ke folder data/ → redeploy. "
-                "Setelah itu, tabel prioritas akan otomatis menampilkan kolom label & action."
-            )
+    st.markdown('<div class="hr"></div>', unsafe_allow_html=True)
+
+    # Recommended: Label & Action Builder (in-app) -> download topic_label_map.csv
+    st.markdown("### D) (Saran yang aku lakukan) Label & Action Builder (untuk laporan & dashboard)")
+    st.caption(
+        "Kamu butuh label topik + rekomendasi aksi yang manusiawi. Kalau topic_label_map.csv belum ada, "
+        "kamu bisa buat di sini lalu download CSV."
+    )
+
+    # Build base template from available topics: semua topik negatif (cube tanpa filter), bukan tabel A
+    # yang ikut filter -> label/action topik yang sedang tersembunyi tidak hilang dari file download
+    neg_topic_ids = sorted(pd.to_numeric(cube_priority(cube)["topic"], errors="coerce").dropna().astype(int).unique().tolist())
+    pos_topic_ids = []
+    if pos_topics is not None and "topic" in pos_topics.columns:
+        pos_topic_ids = sorted(pd.to_numeric(pos_topics["topic"], errors="coerce").dropna().astype(int).unique().tolist())
+
+    template_rows = []
+    for t in neg_topic_ids:
+        template_rows.append({"sentimen":"negatif", "topic_id":t, "label":"", "action":""})
+    for t in pos_topic_ids:
+        template_rows.append({"sentimen":"positif", "topic_id":t, "label":"", "action":""})
+
+    template_df = pd.DataFrame(template_rows)
+
+    if topic_label_map is not None and not topic_label_map.empty and set(["sentimen","topic_id","label","action"]).issubset(topic_label_map.columns):
+        base = topic_label_map.copy()
+        base["sentimen"] = base["sentimen"].astype(str).str.lower().str.strip()
+        base["topic_id"] = pd.to_numeric(base["topic_id"], errors="coerce")
+        base = base.dropna(subset=["topic_id"]).copy()
+        base["topic_id"] = base["topic_id"].astype(int)
+        # merge to preserve your previous edits (outer: baris label map di luar template tetap ikut)
+        template_df = template_df.merge(base, on=["sentimen","topic_id"], how="outer", suffixes=("", "_old"))
+        # if existing values exist, prefer them
+        for col in ["label","action"]:
+            if f"{col}_old" in template_df.columns:
+                template_df[col] = template_df[f"{col}_old"].fillna(template_df[col])
+                template_df = template_df.drop(columns=[f"{col}_old"])
+
+    edited = st.data_editor(
+        template_df,
+        use_container_width=True,
+        num_rows="dynamic",
+        hide_index=True
+    )
+
+    st.download_button(
+        "⬇️ Download topic_label_map.csv (hasil edit)",
+        data=lazy_csv(("topic_label_map", pd.util.hash_pandas_object(edited).sum()), edited),
+        file_name="topic_label_map.csv",
+        mime="text/csv",
+        use_container_width=True
+    )
+
+    st.info(
+        "Cara pakai: download topic_label_map.csv → taruh ke folder data/. "
+        "Tidak perlu redeploy: file dimuat ulang otomatis dalam beberapa detik, "
+        "lalu tabel prioritas menampilkan kolom label & action."
+    )
+
+    st.markdown('<div class="hr"></div>', unsafe_allow_html=True)
+
+    # Semua ulasan rating rendah (bukan hanya exemplars) untuk telaah manual
+    st.markdown("### E) Semua Ulasan Rating ≤ 2")
+    low_reviews = safe_read_csv(LOW_RATING_REVIEWS, file_fps[LOW_RATING_REVIEWS])
+    if low_reviews is None or low_reviews.empty:
+        st.warning("rating_2kebawah_semua_ulasan.csv tidak tersedia.")
+    else:
+        paged_table("low_reviews", low_reviews, (file_fps[LOW_RATING_REVIEWS],))
 
     card_close()
 
 # ------------------------------------------------------------
 # TAB 4: MODEL QUALITY (EVAL + SUPPORT)
 # ------------------------------------------------------------
-with tab4:
+@st.fragment
+@timed("9) tab Model Quality")
+def render_model_quality():
     card_open(
         "Model Quality (Academic)",
         "Bagian ini menguatkan laporan: pemilihan jumlah topik (K) dengan coherence/perplexity dan kualitas topik (support)."
@@ -799,13 +995,15 @@ with tab4:
         else:
             st.dataframe(neg_eval, use_container_width=True)
             if set(["K","coherence_cv"]).issubset(neg_eval.columns):
-                fig = px.line(neg_eval, x="K", y="coherence_cv", markers=True, template=PX_TEMPLATE)
-                fig.update_layout(height=280, xaxis_title="K (jumlah topik)", yaxis_title="Coherence (c_v)")
-                st.plotly_chart(fig, use_container_width=True)
+                show_figure(
+                    ("neg_coherence", file_fps[NEG_EVAL]),
+                    partial(line_figure, neg_eval, "K", "coherence_cv", 280, "K (jumlah topik)", "Coherence (c_v)"),
+                )
             if set(["K","log_perplexity_test"]).issubset(neg_eval.columns):
-                fig2 = px.line(neg_eval, x="K", y="log_perplexity_test", markers=True, template=PX_TEMPLATE)
-                fig2.update_layout(height=280, xaxis_title="K", yaxis_title="Log Perplexity (test)")
-                st.plotly_chart(fig2, use_container_width=True)
+                show_figure(
+                    ("neg_perplexity", file_fps[NEG_EVAL]),
+                    partial(line_figure, neg_eval, "K", "log_perplexity_test", 280, "K", "Log Perplexity (test)"),
+                )
 
     with c2:
         st.markdown("### POSITIVE — K Selection (coherence/perplexity)")
@@ -814,13 +1012,15 @@ with tab4:
         else:
             st.dataframe(pos_eval, use_container_width=True)
             if set(["K","coherence_cv"]).issubset(pos_eval.columns):
-                fig = px.line(pos_eval, x="K", y="coherence_cv", markers=True, template=PX_TEMPLATE)
-                fig.update_layout(height=280, xaxis_title="K (jumlah topik)", yaxis_title="Coherence (c_v)")
-                st.plotly_chart(fig, use_container_width=True)
+                show_figure(
+                    ("pos_coherence", file_fps[POS_EVAL]),
+                    partial(line_figure, pos_eval, "K", "coherence_cv", 280, "K (jumlah topik)", "Coherence (c_v)"),
+                )
             if set(["K","log_perplexity_test"]).issubset(pos_eval.columns):
-                fig2 = px.line(pos_eval, x="K", y="log_perplexity_test", markers=True, template=PX_TEMPLATE)
-                fig2.update_layout(height=280, xaxis_title="K", yaxis_title="Log Perplexity (test)")
-                st.plotly_chart(fig2, use_container_width=True)
+                show_figure(
+                    ("pos_perplexity", file_fps[POS_EVAL]),
+                    partial(line_figure, pos_eval, "K", "log_perplexity_test", 280, "K", "Log Perplexity (test)"),
+                )
 
     st.markdown('<div class="hr"></div>', unsafe_allow_html=True)
 
@@ -831,63 +1031,96 @@ with tab4:
         if neg_support is None or neg_support.empty:
             st.warning("neg_support.csv tidak tersedia.")
         else:
-            st.dataframe(neg_support, use_container_width=True)
+            paged_table("neg_support", neg_support, (file_fps[NEG_SUPPORT],))
     with s2:
         st.markdown("**POSITIF — Support**")
         if pos_support is None or pos_support.empty:
             st.warning("pos_support.csv tidak tersedia.")
         else:
-            st.dataframe(pos_support, use_container_width=True)
+            paged_table("pos_support", pos_support, (file_fps[POS_SUPPORT],))
 
     card_close()
 
 # ------------------------------------------------------------
 # TAB 5: DEPLOYMENT (UPLOAD & EXPORT)
 # ------------------------------------------------------------
-with tab5:
+@st.fragment
+@timed("9) tab Deployment")
+def render_deployment():
     card_open(
         "Deployment (Upload & Export)",
         "Untuk konversi mata kuliah deployment aplikasi: bukti aplikasi bisa menerima input baru (CSV) dan mengeluarkan output (export). "
-        "Namun, topic modeling tetap export-first agar stabil."
+        "Topic modeling tetap export-first; upload tanpa topic_id diberi topik dari top words hasil export."
     )
 
     st.markdown("### Upload CSV opsional")
     uploaded = st.file_uploader("Upload CSV (opsional). Jika kosong, pakai dataset_final.csv (terfilter).", type=["csv"])
 
+    # model inferensi topik (top words neg/pos_topics.csv), hanya dipakai kalau upload tidak punya kolom topic
+    infer_topics = None
+    if file_fps[NEG_TOPICS] is not None and file_fps[POS_TOPICS] is not None:
+        try:
+            infer_topics = load_topic_inference(NEG_TOPICS, file_fps[NEG_TOPICS], POS_TOPICS, file_fps[POS_TOPICS])
+        except Exception as e:
+            st.warning(f"Model inferensi topik tidak bisa dibuat dari neg/pos_topics.csv: {e}")
+
     if uploaded is not None:
         try:
-            raw = pd.read_csv(uploaded)
-            df_u, schema_u, err_u = standardize_dataset(raw)
+            # hash isi dihitung sekali per file upload (bukan tiap rerun)
+            if st.session_state.get("upload_digest", (None,))[0] != uploaded.file_id:
+                st.session_state.upload_digest = (uploaded.file_id, content_digest(uploaded))
+            # streaming per chunk (hanya saat cache miss): distribusi diakumulasi, yang disimpan hanya sampel
+            bar = st.empty()
+            df_u, cube_u, schema_u, err_u = load_upload(
+                uploaded, st.session_state.upload_digest[1],
+                on_progress=lambda f: bar.progress(f, text=f"Validasi upload... {f:.0%}"),
+                infer_topics=infer_topics,
+            )
+            bar.empty()
             if err_u:
                 st.error(f"CSV upload tidak valid: {err_u}")
-                df_live = df_view
+                df_live, idx_live, texts_live, cube_live = df_std, view_idx, texts_std, cube_view
+                live_version = (data_version, view_filters)
                 st.info("Fallback ke dataset_final (terfilter).")
             else:
-                df_live = df_u
-                st.success("✅ Upload valid. Dataset upload dipakai untuk overview & export.")
+                df_live, texts_live = split_text(df_u)
+                idx_live = None
+                cube_live = cube_u
+                live_version = ("upload", st.session_state.upload_digest[1], getattr(infer_topics, "version", None))
+                st.success(
+                    f"✅ Upload valid ({nice_number(cube_u['n'].sum())} baris). "
+                    "Dataset upload dipakai untuk overview & export."
+                )
+                if schema_u.get("topic_col") == INFERRED_TOPIC_COL:
+                    n_unassigned = int(cube_u.loc[cube_u["topic_id"] == UNASSIGNED_TOPIC, "n"].sum())
+                    st.info(
+                        "🧩 Upload tidak punya kolom topic -> topic_id & dom_prob diinferensi dari top words "
+                        f"neg/pos_topics.csv. {nice_number(n_unassigned)} ulasan tanpa kata kunci topik "
+                        f"(topic_id = {UNASSIGNED_TOPIC})."
+                    )
         except Exception as e:
             st.error(f"Gagal membaca CSV upload: {e}")
-            df_live = df_view
+            df_live, idx_live, texts_live, cube_live = df_std, view_idx, texts_std, cube_view
+            live_version = (data_version, view_filters)
     else:
-        df_live = df_view
+        df_live, idx_live, texts_live, cube_live = df_std, view_idx, texts_std, cube_view
+        live_version = (data_version, view_filters)
         st.info("ℹ️ Menggunakan dataset_final (terfilter bila filter aktif).")
 
     st.markdown('<div class="hr"></div>', unsafe_allow_html=True)
 
     st.markdown("### Output cepat (untuk bukti deployment)")
     # Export small summaries from uploaded or dataset_final
-    out_sent = df_live.groupby("sentimen").size().reset_index(name="jumlah").sort_values("jumlah", ascending=False)
-    out_rate = df_live.groupby("rating").size().reset_index(name="jumlah").sort_values("rating")
+    out_sent = cube_counts(cube_live, "sentimen").sort_values("jumlah", ascending=False)
+    out_rate = cube_counts(cube_live, "rating").sort_values("rating")
 
     c1, c2 = st.columns(2, gap="large")
     with c1:
         st.markdown("**Distribusi Sentimen (dynamic)**")
-        fig = px.bar(out_sent, x="sentimen", y="jumlah", template=PX_TEMPLATE)
-        fig.update_layout(height=280, xaxis_title="Sentimen", yaxis_title="Jumlah")
-        st.plotly_chart(fig, use_container_width=True)
+        show_figure(("live_sentiment", live_version), partial(bar_figure, out_sent, "sentimen", "jumlah", 280, "Sentimen", "Jumlah"))
         st.download_button(
             "⬇️ Download sentiment_counts_dynamic.csv",
-            data=out_sent.to_csv(index=False).encode("utf-8"),
+            data=lazy_csv(("sentiment_counts", live_version), out_sent),
             file_name="sentiment_counts_dynamic.csv",
             mime="text/csv",
             use_container_width=True
@@ -895,12 +1128,10 @@ with tab5:
 
     with c2:
         st.markdown("**Distribusi Rating (dynamic)**")
-        fig2 = px.bar(out_rate, x="rating", y="jumlah", template=PX_TEMPLATE)
-        fig2.update_layout(height=280, xaxis_title="Rating", yaxis_title="Jumlah")
-        st.plotly_chart(fig2, use_container_width=True)
+        show_figure(("live_rating", live_version), partial(bar_figure, out_rate, "rating", "jumlah", 280, "Rating", "Jumlah"))
         st.download_button(
             "⬇️ Download rating_counts_dynamic.csv",
-            data=out_rate.to_csv(index=False).encode("utf-8"),
+            data=lazy_csv(("rating_counts", live_version), out_rate),
             file_name="rating_counts_dynamic.csv",
             mime="text/csv",
             use_container_width=True
@@ -911,19 +1142,253 @@ with tab5:
     st.caption("Kamu bisa export subset data untuk lampiran (contoh 200 baris).")
 
     n_rows = st.slider("Jumlah baris export (subset)", 50, 1000, 200, step=50)
-    subset = df_live.head(n_rows).copy()
     st.download_button(
         "⬇️ Download dataset_subset.csv",
-        data=subset.to_csv(index=False).encode("utf-8"),
+        data=lazy_csv(("subset", live_version, n_rows), partial(rows_with_text, df_live, idx_live, texts_live, n_rows)),
         file_name="dataset_subset.csv",
         mime="text/csv",
         use_container_width=True
     )
 
+    st.markdown('<div class="hr"></div>', unsafe_allow_html=True)
+    st.markdown("### Export lengkap (semua baris, terfilter)")
+    st.caption("Dibuat di background lalu disimpan di server per versi data & filter, jadi export yang sama langsung siap untuk user lain.")
+
+    full_fmt = st.selectbox("Format export lengkap", available_formats())
+    full_ext, full_mime = FULL_EXPORT_FORMATS[full_fmt]
+    full_key = export_key("full", live_version, full_ext)
+    full_err = xlsx_too_large(int(cube_live["n"].sum())) if full_ext == "xlsx" else None
+    if full_err:
+        st.warning(full_err)   # ditolak sebelum job dibuat (tanpa membaca baris sama sekali)
+    elif st.button("⚙️ Siapkan export lengkap", use_container_width=True):
+        if live_version[0] == "upload":
+            full_chunks = partial(iter_upload_chunks, uploaded.getvalue(), infer_topics=infer_topics)
+        else:
+            full_chunks = partial(iter_view_chunks, df_live, idx_live, texts_live)
+        get_export_jobs().submit(full_key, full_ext, full_chunks)
+    if get_export_jobs().status(full_key, full_ext)[0] == "running":
+        full_export_poll(full_key, full_ext)
+    else:
+        full_export_panel(full_key, full_ext, full_mime)
+
+    card_close()
+
+# ------------------------------------------------------------
+# TAB 6: CARI ULASAN (FULL-TEXT SEARCH)
+# ------------------------------------------------------------
+@st.fragment
+@timed("9) tab Cari Ulasan")
+def render_search():
+    card_open(
+        "Cari Ulasan",
+        "Pencarian teks ulasan lewat inverted index (dibangun sekali per versi data). "
+        "Semua kata harus muncul; akhiran * untuk awalan kata (mis. verif*). Filter global di sidebar ikut berlaku."
+    )
+
+    c1, c2 = st.columns([2.2, 1.0], gap="large")
+    with c1:
+        query = st.text_input("Kata kunci", placeholder="contoh: gagal login, verif*")
+    with c2:
+        source = st.selectbox("Sumber", list(SEARCH_SOURCES))
+    src_path, text_col, topic_col = SEARCH_SOURCES[source]
+
+    if src_path == DATASET_FINAL:
+        frame, texts, src_version = df_std, texts_std, data_version
+    else:
+        frame = safe_read_csv(src_path, file_fps[src_path])
+        if frame is None or frame.empty or not {text_col, topic_col, "rating", "sentimen"}.issubset(frame.columns):
+            st.warning(f"{src_path.name} tidak tersedia / format tidak sesuai.")
+            card_close()
+            return
+        texts, src_version = frame[text_col], file_fps[src_path]
+
+    topic_vals = cube["topic_id"] if src_path == DATASET_FINAL else frame[topic_col]   # df_std bersegmen -> dari cube
+    topic_filter = st.multiselect("Topic", sorted(pd.unique(topic_vals).tolist()))
+
+    if not query.strip():
+        st.caption("Masukkan kata kunci untuk mulai mencari.")
+        card_close()
+        return
+
+    t0 = perf_counter()
+    if src_path == DATASET_FINAL:
+        index = live_search_index(DATASET_FINAL, live)   # index dataset_final + index per delta incoming/
+    else:
+        index = load_search_index(src_path, file_fps[src_path], texts)
+    hits = index.search(query)
+    hits = hits[hits < len(frame)]   # delta yang masuk setelah rerun ini terlihat di rerun berikutnya
+    hits = filter_hits(hits, frame, rating_filter, sent_filter, topic_filter, topic_col)
+    elapsed_ms = (perf_counter() - t0) * 1000
+
+    st.caption(f"{nice_number(len(hits))} hasil • {elapsed_ms:.1f} ms")
+    search_version = (src_version, query, view_filters, tuple(sorted(topic_filter)))
+    if src_path == DATASET_FINAL:
+        paged_table("search", df_std, search_version, idx=hits, texts=texts_std)
+    else:
+        paged_table("search", frame, search_version, idx=hits)
+
+    card_close()
+
+# ------------------------------------------------------------
+# TAB 7: DERET WAKTU & ANALISIS KEBIJAKAN
+# ------------------------------------------------------------
+@st.fragment
+@timed("9) tab Deret Waktu")
+def render_timeseries_policy():
+    card_open(
+        "Deret Waktu & Analisis Kebijakan",
+        "Tren KB aktif bulanan, forecast skenario 2025 (delta vs Base) dan ringkasan evaluasi model."
+    )
+
+    fp_monthly, fp_forecast = file_fps[MONTHLY_CSV], file_fps[FORECAST_CSV]
+    if fp_monthly is None or fp_forecast is None:
+        st.warning("data_clean_monthly.csv / forecast_kb_aktif_2025_skenario.csv tidak tersedia.")
+        card_close()
+        return
+    # tanggal sudah di-parse, terurut & delta skenario sudah dihitung (cache per versi file)
+    monthly = load_monthly_series(MONTHLY_CSV, fp_monthly)
+    forecast, scenarios = load_forecast(FORECAST_CSV, fp_forecast)
+    if monthly.empty or "kb_aktif" not in monthly.columns or not scenarios:
+        st.warning("Format data_clean_monthly.csv / forecast tidak sesuai (butuh kolom bulan, kb_aktif, skenario).")
+        card_close()
+        return
+
+    min_d = monthly[TS_DATE_COL].iloc[0].to_pydatetime()
+    max_d = monthly[TS_DATE_COL].iloc[-1].to_pydatetime()
+    date_range = (min_d, max_d)
+    if min_d < max_d:
+        date_range = st.slider("Rentang Bulan (Historis)", min_value=min_d, max_value=max_d, value=(min_d, max_d), format="YYYY-MM")
+    c1, c2 = st.columns(2, gap="large")
+    with c1:
+        show_pus = st.toggle("Tampilkan PUS", value=True) if "pus" in monthly.columns else False
+    with c2:
+        skenario = st.selectbox("Skenario Forecast", scenarios)
+    mview = range_slice(monthly, *date_range)
+
+    t1, t2, t3 = st.tabs(["📈 Tren Historis", "🔮 Forecast 2025", "📌 Evaluasi Model"])
+
+    with t1:
+        show_figure(("ts_history", fp_monthly, date_range, show_pus), partial(history_figure, mview, show_pus))
+        st.caption(f"{nice_number(len(mview))} bulan ditampilkan • histori panjang di-downsample (LTTB) per seri")
+
+        st.markdown("**Catatan kebijakan (template):**")
+        st.write("- Tentukan tanggal intervensi kebijakan → bandingkan rata-rata before–after.")
+        st.write("- Tambahkan indikator eksternal (mis. program/anggaran/edukasi) untuk interpretasi.")
+
+    with t2:
+        show_figure(
+            ("ts_forecast", fp_forecast, fp_monthly, skenario),
+            partial(forecast_figure, forecast, monthly, skenario),
+        )
+
+        st.markdown("**Ringkasan skenario (delta vs Base & vs rata-rata 12 bulan terakhir)**")
+        st.dataframe(
+            load_scenario_summary(FORECAST_CSV, fp_forecast, MONTHLY_CSV, fp_monthly),
+            use_container_width=True, hide_index=True
+        )
+        if f"delta_{skenario}" in forecast.columns and forecast[f"delta_{skenario}"].abs().sum() > 0:
+            show_figure(
+                ("ts_delta", fp_forecast, skenario),
+                partial(bar_figure, forecast, TS_DATE_COL, f"delta_{skenario}", 280, "Bulan", f"Delta {skenario} vs Base"),
+            )
+
+        with st.expander("Lihat tabel forecast"):
+            st.dataframe(forecast, use_container_width=True)
+
+    with t3:
+        metrics = safe_read_csv(MODEL_METRICS, file_fps[MODEL_METRICS])
+        if metrics is None or metrics.empty:
+            st.warning("model_summary_metrics.csv tidak tersedia.")
+        else:
+            row = metrics.iloc[0].to_dict()
+            st.markdown(
+                f"""
+                <div class="kpi-grid">
+                  <div class="kpi"><div class="kpi-k">Benchmark MAPE</div><div class="kpi-v">{float(row.get("benchmark_mape", np.nan)):.2f}</div><div class="kpi-note">lebih kecil lebih baik</div></div>
+                  <div class="kpi"><div class="kpi-k">SARIMAX MAPE</div><div class="kpi-v">{float(row.get("sarimax_mape", np.nan)):.2f}</div><div class="kpi-note">model utama</div></div>
+                  <div class="kpi"><div class="kpi-k">Walkforward MAPE</div><div class="kpi-v">{float(row.get("walkforward_mape", np.nan)):.2f}</div><div class="kpi-note">uji rolling</div></div>
+                  <div class="kpi"><div class="kpi-k">Pearson r</div><div class="kpi-v">{float(row.get("pearson_r", np.nan)):.3f}</div><div class="kpi-note">p = {float(row.get("pearson_p", np.nan)):.4f}</div></div>
+                </div>
+                """,
+                unsafe_allow_html=True
+            )
+            st.write(f"- best_order: `{row.get('best_order')}`")
+            st.write(f"- best_seasonal: `{row.get('best_seasonal')}`")
+
+    st.markdown('<div class="hr"></div>', unsafe_allow_html=True)
+    st.markdown("### Export")
+    e1, e2, e3 = st.columns(3)
+    with e1:
+        st.download_button(
+            "⬇️ Download data_clean_monthly.csv",
+            data=lazy_csv(("monthly", fp_monthly), monthly),
+            file_name="data_clean_monthly.csv",
+            mime="text/csv",
+            use_container_width=True
+        )
+    with e2:
+        st.download_button(
+            "⬇️ Download forecast (+ delta skenario).csv",
+            data=lazy_csv(("forecast", fp_forecast), forecast),
+            file_name="forecast_kb_aktif_2025_skenario.csv",
+            mime="text/csv",
+            use_container_width=True
+        )
+    with e3:
+        if metrics is not None and not metrics.empty:
+            st.download_button(
+                "⬇️ Download model_summary_metrics.csv",
+                data=lazy_csv(("model_metrics", file_fps[MODEL_METRICS]), metrics),
+                file_name="model_summary_metrics.csv",
+                mime="text/csv",
+                use_container_width=True
+            )
+
     card_close()
 
+for tab, render_tab in (
+    (tab1, render_overview),
+    (tab2, render_topic_modeling),
+    (tab3, render_people_analytics),
+    (tab4, render_model_quality),
+    (tab5, render_deployment),
+    (tab6, render_search),
+    (tab7, render_timeseries_policy),
+):
+    if tab.open:
+        with tab:
+            render_tab()
+
+rerun_watch.total("rerun total")
+
+# ============================================================
+# 10) PERF PANEL (hanya user admin)
+#    - p50/p95/p99 per section dari ring buffer (semua session di proses ini)
+# ============================================================
+if st.session_state.username == "admin" and "admin" in USERS:
+    with st.sidebar:
+        st.markdown('<div class="hr"></div>', unsafe_allow_html=True)
+        with st.expander("⏱️ Performa (admin)", expanded=False):
+            ring = get_timing_ring()
+            perf_stats = ring.stats()
+            if perf_stats.empty:
+                st.caption("Belum ada data timing.")
+            else:
+                st.caption(f"{nice_number(int(perf_stats['n'].sum()))} sampel terakhir • urut p95 terbesar (ms)")
+                st.dataframe(perf_stats.head(15).round(1), use_container_width=True, hide_index=True)
+                st.download_button(
+                    "⬇️ Download timing (CSV)",
+                    data=lazy_csv(("perf_timings", ring.version), ring.frame),
+                    file_name="perf_timings.csv",
+                    mime="text/csv",
+                    use_container_width=True
+                )
+            if st.button("🧹 Reset timing", use_container_width=True):
+                ring.clear()
+                st.rerun()
+
 # ============================================================
-# 10) FOOTER
+# 11) FOOTER
 # ============================================================
 st.caption(
     f"© {datetime.now().year} • Export-first dashboard• "
@@ -0,0 +1,239 @@
+# Benchmark jalur data dashboard (headless, tanpa browser):
+#   python benchmark.py                               # skala default 10k,100k,1M -> JSON ke stdout
+#   python benchmark.py --scales 10k,10M --out bench.json
+#   python benchmark.py --out new.json --compare bench.json   # bandingkan dengan baseline rilis sebelumnya
+# Data sintetis berbentuk dataset_final.csv (+ neg_action, topic_label_map, neg_exemplars yang cocok,
+# + 1 delta di incoming/) dibuat di folder sementara, lalu fungsi asli data_layer / exports diukur apa adanya.
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import streamlit.logger
+
+streamlit.logger.set_log_level("error")   # "No runtime found" saat st.cache_* dipakai tanpa server
+
+from data_layer import (
+    INCOMING_DIR, build_count_cube, cube_kpis, cube_priority, cube_slice, exemplar_rows, file_fingerprint,
+    iter_view_chunks, load_dataset_final, load_exemplar_index, load_live_dataset, merge_label_map, read_csv_cached,
+    sidecar_path, split_text, standardize_dataset,
+)
+from exports import WRITERS, XLSX_MAX_ROWS, render_csv, spool_path
+
+DEFAULT_SCALES = "10k,100k,1M"
+N_TOPICS = 8
+TEXT_POOL = 20_000          # teks unik; baris lain mengambil sampel dari pool (generate 10M tetap cepat)
+DELTA_FRACTION = 0.01       # ukuran delta incoming/ relatif terhadap dataset_final
+XLSX_BENCH_MAX_ROWS = 100_000
+FILTERS = [                 # kombinasi filter sidebar yang diukur (rating, sentimen)
+    ((), ()),
+    ((1.0, 2.0), ()),
+    ((), ("negatif",)),
+    ((4.0, 5.0), ("positif", "netral")),
+]
+
+WORDS = np.array(
+    "aplikasi daftar akun login masuk gagal error data verifikasi email nik kua nikah sertifikat elsimil "
+    "update versi download server lambat loading susah mudah bantu mantap bagus baik tolong mohon cepat "
+    "program kb catin syarat dokumen upload foto hapus ganti password otp kode kirim tunggu lama muter "
+    "play store android hp jaringan sinyal petugas lapang kader bidan layanan informasi fitur menu".split()
+)
+
+def parse_scale(s: str) -> int:
+    s = s.strip().lower()
+    mult = {"k": 1_000, "m": 1_000_000}.get(s[-1], 1)
+    return int(float(s[:-1] if s[-1] in "km" else s) * mult)
+
+def make_dataset(n: int, rng: np.random.Generator) -> pd.DataFrame:
+    pool_n = min(n, TEXT_POOL)
+    lens = rng.integers(4, 25, size=pool_n)
+    words = WORDS[rng.integers(0, len(WORDS), size=int(lens.sum()))]
+    pool = np.array([" ".join(ws) for ws in np.split(words, np.cumsum(lens)[:-1])], dtype=object)
+    sentimen = rng.choice(np.array(["positif", "negatif", "netral"]), size=n, p=[0.45, 0.45, 0.10])
+    neg = sentimen == "negatif"
+    rating = np.where(neg, rng.choice([1, 2, 3], size=n, p=[0.6, 0.3, 0.1]), rng.integers(3, 6, size=n))
+    return pd.DataFrame({
+        "sentimen": sentimen,
+        "topic_id": rng.integers(0, N_TOPICS, size=n),
+        "rating": rating,
+        "text": pool[rng.integers(0, pool_n, size=n)],
+        "dom_prob": rng.uniform(0.2, 1.0, size=n).round(6),
+    })
+
+def make_exports(raw: pd.DataFrame, rng: np.random.Generator) -> dict[str, pd.DataFrame]:
+    # export yang "cocok" dengan dataset sintetis: neg_action dari cube, exemplars = sampel ulasan negatif
+    std, _, _ = standardize_dataset(raw)
+    na = cube_priority(build_count_cube(std)).rename(columns={"topic": "dom_topic"})
+    na["top_words"] = [", ".join(rng.choice(WORDS, 10, replace=False)) for _ in range(len(na))]
+    label_map = pd.DataFrame({
+        "sentimen": np.repeat(["negatif", "positif"], N_TOPICS),
+        "topic_id": np.tile(np.arange(N_TOPICS), 2),
+        "label": [f"Topik {s} {t}" for s in ("negatif", "positif") for t in range(N_TOPICS)],
+        "action": "Tindak lanjut",
+    })
+    neg = raw[raw["sentimen"] == "negatif"]
+    ex = neg.sample(n=min(len(neg), max(len(raw) // 50, 40)), random_state=0)
+    ex = pd.DataFrame({
+        "topic": ex["topic_id"], "dom_prob": ex["dom_prob"],
+        "overlap_topwords": rng.integers(1, 6, size=len(ex)), "text": ex["text"], "rating": ex["rating"].astype(float),
+    })
+    return {"neg_action": na, "topic_label_map": label_map, "neg_exemplars": ex}
+
+def timed(fn, repeat: int, setup=None) -> dict:
+    runs = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        t0 = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - t0)
+    return {"min_s": round(min(runs), 6), "median_s": round(float(np.median(runs)), 6), "runs": len(runs)}
+
+def bench_scale(n: int, repeat: int, workdir: Path, seed: int, log) -> dict:
+    rng = np.random.default_rng(seed)
+    log(f"[{n:,}] generate data sintetis")
+    raw = make_dataset(n, rng)
+    path = workdir / "dataset_final.csv"
+    raw.to_csv(path, index=False)
+    exports = make_exports(raw, rng)
+    fp = file_fingerprint(path)
+    out = {"rows": n, "csv_mb": round(path.stat().st_size / 2**20, 2)}
+    res = out["timings"] = {}
+
+    def run(name, fn, setup=None, times=repeat):
+        log(f"[{n:,}] {name}")
+        res[name] = timed(fn, times, setup)
+
+    # 1) load dataset_final: cold = parse CSV + tulis sidecar Parquet, warm = baca sidecar
+    def cold():
+        load_dataset_final.clear()
+        side = sidecar_path(path, fp)
+        if side is not None:
+            side.unlink(missing_ok=True)
+    run("load_dataset_final_cold", lambda: load_dataset_final(path, fp), setup=cold)
+    run("load_dataset_final_warm", lambda: load_dataset_final(path, fp), setup=load_dataset_final.clear)
+
+    # 2) standardize + struktur turunan (sekali per versi data di app)
+    df = read_csv_cached(path)
+    run("standardize_dataset", lambda: standardize_dataset(df))
+    std, _, _ = standardize_dataset(df)
+    df_std, _ = split_text(std)
+    run("build_count_cube", lambda: build_count_cube(df_std))
+    cube = build_count_cube(df_std)
+
+    # 3) filter global + KPI (per rerun) lewat LiveDataset seperti di app: dataset_final + 1 segmen delta.
+    #    cold = index filter dibangun dari nol (kombinasi filter baru / ter-evict), warm = index sudah ada
+    n_delta = max(int(n * DELTA_FRACTION), 1)
+    delta = make_dataset(n_delta, rng)
+    delta["text"] = [f"{t} baru{i}" for i, t in enumerate(delta["text"])]   # lolos dedup teks
+    (workdir / INCOMING_DIR).mkdir()
+    delta.to_csv(workdir / INCOMING_DIR / "delta.csv", index=False)
+    live = load_live_dataset(path, fp)
+    live.apply(sorted((workdir / INCOMING_DIR).glob("*.csv")))
+    frame, live_texts, live_cube, _, _ = live.state()
+    out["delta_rows"] = len(frame) - len(df_std)
+
+    def filter_kpis():
+        for rating_f, sent_f in FILTERS:
+            live.view_index(frame, rating_f, sent_f)
+            cube_kpis(cube_slice(live_cube, rating_f, sent_f))
+    run("live_filter_and_kpis_cold", filter_kpis, setup=live.clear_view_index)
+    run("live_filter_and_kpis_warm", filter_kpis)
+
+    # 4) tabel prioritas: export neg_action + topic_label_map, dan versi live dari cube
+    na = exports["neg_action"].rename(columns={"dom_topic": "topic"})
+    run("neg_action_label_merge", lambda: merge_label_map(na, exports["topic_label_map"]))
+    run("priority_from_cube", lambda: cube_priority(cube))
+
+    # 5) exemplars: bangun index (sekali per file) + lookup per topic (per rerun)
+    ex = exports["neg_exemplars"]
+    ex_fp = ("neg_exemplars", n, seed)
+    run("exemplar_index_build", lambda: load_exemplar_index(ex_fp, ex), setup=load_exemplar_index.clear)
+    ex_index = load_exemplar_index(ex_fp, ex)
+    run("exemplar_lookup", lambda: [exemplar_rows(ex_index, t, 20) for t in ex_index[2]])
+
+    # 6) serialisasi export (view terfilter dataset live): CSV download + export penuh per format
+    idx = live.view_index(frame, (1.0, 2.0), ())
+    view = pd.concat(list(iter_view_chunks(frame, idx, live_texts)), ignore_index=True)
+    spool = spool_path("bench", "csv")   # view > SPOOL_ROWS ditulis ke disk, bukan ke bytes
+    run("export_csv_download", lambda: render_csv(view, "bench"), setup=lambda: spool.unlink(missing_ok=True))
+    spool.unlink(missing_ok=True)
+    for ext, writer in WRITERS.items():
+        if ext == "xlsx" and len(idx) > min(XLSX_BENCH_MAX_ROWS, XLSX_MAX_ROWS):
+            continue   # openpyxl sangat lambat untuk data besar; tidak informatif
+        target = workdir / f"export.{ext}"
+        run(f"export_full_{ext.replace('.', '_')}", lambda: writer(iter_view_chunks(frame, idx, live_texts), target))
+    out["view_rows_exported"] = int(len(idx))
+    return out
+
+def compare(new: dict, old: dict, threshold: float) -> list[str]:
+    # rasio median baru / lama per (skala, langkah); > 1 + threshold = lebih lambat
+    lines = []
+    for scale, res in new["results"].items():
+        base = old.get("results", {}).get(scale)
+        if not base:
+            continue
+        for name, t in res["timings"].items():
+            b = base["timings"].get(name)
+            if not b or not b["median_s"]:
+                continue
+            ratio = t["median_s"] / b["median_s"]
+            flag = "🔴 LEBIH LAMBAT" if ratio > 1 + threshold else ("🟢 lebih cepat" if ratio < 1 - threshold else "")
+            lines.append(f"{scale:>6} {name:<28} {b['median_s']:>10.4f}s -> {t['median_s']:>10.4f}s  x{ratio:5.2f} {flag}")
+    return lines
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark jalur data dashboard dengan data sintetis.")
+    ap.add_argument("--scales", default=DEFAULT_SCALES, help="daftar skala, mis. 10k,100k,1M,10M")
+    ap.add_argument("--repeat", type=int, default=3, help="jumlah pengulangan per langkah (dipakai min & median)")
+    ap.add_argument("--seed", type=int, default=42)
+    ap.add_argument("--out", type=Path, help="tulis hasil JSON ke file (default: stdout)")
+    ap.add_argument("--compare", type=Path, help="JSON baseline untuk dibandingkan")
+    ap.add_argument("--threshold", type=float, default=0.2, help="batas selisih relatif untuk ditandai (default 0.2)")
+    ap.add_argument("--workdir", type=Path, help="folder data sintetis (default: folder sementara, dihapus setelah selesai)")
+    args = ap.parse_args(argv)
+
+    def log(msg):
+        print(msg, file=sys.stderr, flush=True)
+
+    result = {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "repeat": args.repeat,
+            "seed": args.seed,
+        },
+        "results": {},
+    }
+    for scale in [s.strip() for s in args.scales.split(",") if s.strip()]:
+        workdir = Path(tempfile.mkdtemp(prefix="siga_bench_", dir=args.workdir))
+        try:
+            result["results"][scale] = bench_scale(parse_scale(scale), args.repeat, workdir, args.seed, log)
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    text = json.dumps(result, indent=2, ensure_ascii=False)
+    if args.out:
+        args.out.write_text(text + "\n", encoding="utf-8")
+        log(f"✅ hasil -> {args.out}")
+    else:
+        print(text)
+    if args.compare:
+        lines = compare(result, json.loads(args.compare.read_text(encoding="utf-8")), args.threshold)
+        log("\n".join(lines) if lines else "⚠️ tidak ada skala/langkah yang sama dengan baseline.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,13 @@
+# Build step (jalankan saat deploy / setelah update data/):
+#   python build_cache.py
+# Mengonversi setiap data/*.csv menjadi sidecar Parquet (data/.cache/) agar cold start cepat.
+# Kalau langkah ini dilewati, app.py tetap membuat sidecar secara lazy saat file pertama dibaca.
+from pathlib import Path
+
+from data_layer import build_sidecars
+
+DATA = Path(__file__).parent / "data"
+
+if __name__ == "__main__":
+    for name, side in build_sidecars(DATA).items():
+        print(f"{'✅' if side else '⚠️'} {name} -> {side.name if side else 'gagal (pakai CSV)'}")
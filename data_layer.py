@@ -0,0 +1,963 @@
+import streamlit as st
+import pandas as pd
+from pathlib import Path
+import glob
+import hashlib
+import io
+import json
+import os
+import re
+import textwrap
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Callable
+import numpy as np
+from pandas.api.types import union_categoricals
+
+# ============================================================
+# FILE FINGERPRINT (cache key per versi data)
+# ============================================================
+def file_fingerprint(path: Path) -> tuple[str, int, int] | None:
+    # (path, mtime, size) -> berubah otomatis kalau file di data/ diganti
+    try:
+        s = path.stat()
+    except OSError:
+        return None
+    return (str(path), s.st_mtime_ns, s.st_size)
+
+def file_fingerprints(paths: list[Path]) -> dict[Path, tuple | None]:
+    # satu stat() per file per rerun, dipakai bersama loader + panel Status File
+    return {p: file_fingerprint(p) for p in paths}
+
+# ============================================================
+# COLUMNAR SIDECAR (Parquet) untuk data/*.csv
+#   data/.cache/<nama>.csv.<mtime_ns>_<size>.parquet
+#   -> dibuat oleh build_cache.py saat deploy, atau lazy saat pertama dibaca
+# ============================================================
+SIDECAR_DIR = ".cache"
+
+def sidecar_path(path: Path, fingerprint: tuple | None = None) -> Path | None:
+    fp = fingerprint or file_fingerprint(path)
+    if fp is None:
+        return None
+    _, mtime_ns, size = fp
+    return path.parent / SIDECAR_DIR / f"{path.name}.{mtime_ns}_{size}.parquet"
+
+def write_atomic(path: Path, write: Callable[[Path], None]) -> Path:
+    # tulis ke file tmp lalu rename: pembaca tidak pernah lihat file setengah jadi.
+    # Nama tmp unik per penulis (watcher & semua session jalan di pid yang sama).
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write(tmp)
+        tmp.replace(path)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return path
+
+def store_sidecar(path: Path, side: Path, suffix: str, write: Callable[[Path], None]) -> Path:
+    # side = data/.cache/<nama>.<mtime_ns>_<size><suffix> -> tulis versi baru, hapus versi lama jenis yang sama
+    write_atomic(side, write)
+    pattern = re.compile(re.escape(path.name) + r"\.\d+_\d+" + re.escape(suffix))
+    for old in side.parent.glob(f"{glob.escape(path.name)}.*{suffix}"):
+        if old != side and pattern.fullmatch(old.name):
+            old.unlink(missing_ok=True)
+    return side
+
+def write_sidecar(path: Path, df: pd.DataFrame, fingerprint: tuple | None = None) -> Path | None:
+    side = sidecar_path(path, fingerprint)
+    if side is None:
+        return None
+    try:
+        return store_sidecar(path, side, ".parquet", lambda tmp: df.to_parquet(tmp, index=False))
+    except Exception:
+        # folder read-only / tipe kolom tidak didukung parquet -> tetap jalan pakai CSV
+        return None
+
+def read_csv_cached(path: Path) -> pd.DataFrame:
+    fp = file_fingerprint(path)
+    side = sidecar_path(path, fp)
+    if side is not None and side.exists():
+        try:
+            return pd.read_parquet(side)
+        except Exception:
+            pass   # sidecar rusak -> baca ulang CSV & tulis ulang sidecar
+    df = pd.read_csv(path)
+    write_sidecar(path, df, fp)
+    return df
+
+def build_sidecars(data_dir: Path) -> dict[str, Path | None]:
+    out = {}
+    for p in sorted(data_dir.glob("*.csv")):
+        try:
+            out[p.name] = write_sidecar(p, pd.read_csv(p))
+        except Exception:
+            out[p.name] = None
+    return out
+
+# ============================================================
+# CORE STANDARDIZATION (dataset_final)
+# ============================================================
+def coalesce_col(df: pd.DataFrame, candidates: list[str]) -> str | None:
+    for c in candidates:
+        if c in df.columns:
+            return c
+    return None
+
+def normalize_sentiment(x) -> str:
+    if pd.isna(x): return ""
+    s = str(x).strip().lower()
+    if s in {"positive","positif","pos"}: return "positif"
+    if s in {"negative","negatif","neg"}: return "negatif"
+    if s in {"neutral","netral","neu"}: return "netral"
+    return s
+
+def normalize_sentiment_series(s: pd.Series) -> pd.Series:
+    # vectorized: normalisasi hanya nilai unik (factorize) lalu map balik -> categorical
+    codes, uniques = pd.factorize(s)
+    norm = [normalize_sentiment(u) for u in uniques] + [""]   # slot terakhir = NaN (code -1)
+    cats = pd.Index(sorted(set(norm)))
+    lookup = cats.get_indexer(norm)
+    out = pd.Categorical.from_codes(lookup[codes], categories=cats).remove_unused_categories()
+    return pd.Series(out, index=s.index, name=s.name)
+
+DATE_CANDIDATES = ["date","at","tanggal","timestamp","waktu"]
+
+def parse_dates(s: pd.Series) -> pd.Series:
+    # tanggal tidak valid -> NaT (baris tetap dipakai, hanya tidak masuk tren waktu);
+    # timezone dibuang supaya semua sumber (CSV / scraper) bisa digabung
+    return pd.to_datetime(s, errors="coerce", utc=True).dt.tz_localize(None).astype("datetime64[ns]")
+
+INFERRED_TOPIC_COL = "(inferensi top words)"   # schema["topic_col"] kalau topic_id dihitung dari teks
+
+def standardize_dataset(df: pd.DataFrame, infer_topics=None) -> tuple[pd.DataFrame, dict, str | None]:
+    # infer_topics (opsional): callable(texts, sentimen) -> (topic_id, dom_prob), dipakai
+    # hanya kalau kolom topic tidak ada (mis. upload ulasan baru, lihat topic_inference.py)
+    sent_col  = coalesce_col(df, ["sentimen","sentiment","label_sentimen","label"])
+    topic_col = coalesce_col(df, ["topic_id","topic","topik","dominant_topic","dom_topic"])
+    rating_col= coalesce_col(df, ["rating","rate","score","bintang","stars"])
+    text_col  = coalesce_col(df, ["text","ulasan","review","komentar","steming_data"])
+    date_col  = coalesce_col(df, DATE_CANDIDATES)   # opsional
+    prob_col  = coalesce_col(df, ["dom_prob","topic_conf","topic_prob"])   # opsional
+
+    infer = topic_col is None and infer_topics is not None
+    schema = {"sent_col": sent_col, "topic_col": INFERRED_TOPIC_COL if infer else topic_col,
+              "rating_col": rating_col, "text_col": text_col}
+    if any(v is None for v in schema.values()):
+        miss = [k for k, v in schema.items() if v is None]
+        return df, schema, f"Kolom wajib tidak ditemukan: {', '.join(miss)}"
+    schema["date_col"] = date_col
+
+    rating = pd.to_numeric(df[rating_col], errors="coerce")
+    if infer:
+        keep = rating.notna()
+    else:
+        topic = pd.to_numeric(df[topic_col], errors="coerce")
+        keep = rating.notna() & topic.notna()
+        topic = topic[keep]
+
+    sentimen = normalize_sentiment_series(df.loc[keep, sent_col])
+    text = df.loc[keep, text_col].astype(str)
+    dom_prob = None
+    if infer:
+        topic_ids, dom_prob = infer_topics(text, sentimen)
+        topic = pd.Series(topic_ids, index=text.index)
+    elif prob_col is not None:
+        dom_prob = pd.to_numeric(df.loc[keep, prob_col], errors="coerce")
+
+    # skema ringkas: categorical sentimen, int8 topic_id (naik otomatis kalau tidak muat), float32 rating
+    out = pd.DataFrame({
+        "sentimen": sentimen,
+        "topic_id": pd.to_numeric(topic.astype(int), downcast="integer"),
+        "rating": rating[keep].astype("float32"),
+        "text": text,
+    })
+    if dom_prob is not None:
+        out["dom_prob"] = np.asarray(dom_prob, dtype="float32")
+    if date_col is not None:
+        out["date"] = parse_dates(df.loc[keep, date_col])
+    return out, schema, None
+
+def split_text(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.Series]:
+    # text disimpan terpisah: filter/groupby/KPI cukup pakai kolom kecil
+    return df.drop(columns=["text"]), df["text"]
+
+def fetch_text(frame: pd.DataFrame, texts: pd.Series) -> pd.DataFrame:
+    # ambil text hanya untuk baris yang diminta (preview / export)
+    return frame.assign(text=texts.reindex(frame.index))
+
+def rows_with_text(df: pd.DataFrame, idx, texts: pd.Series, n: int | None = None) -> pd.DataFrame:
+    return fetch_text(view_rows(df, idx, n), texts)
+
+# ============================================================
+# SERVER-SIDE PAGINATION (urutan baris di-cache per versi + filter + sort)
+# ============================================================
+SORT_CACHE_BUDGET_MB = 256
+
+def load_sorted_positions(version: tuple, sort_col: str, ascending: bool,
+                          df: pd.DataFrame, idx: np.ndarray | None = None) -> np.ndarray:
+    # version harus sudah mewakili isi df dan idx (fingerprint, filter, query, ...).
+    # posisi int32 (4 byte/baris) di registry ber-budget byte, bukan 1 array penuh per kombinasi
+    def build():
+        base = np.arange(len(df), dtype=np.int32) if idx is None else np.asarray(idx).astype(np.int32)
+        vals = df[sort_col].iloc[base].reset_index(drop=True)
+        order = vals.sort_values(ascending=ascending, kind="stable", na_position="last").index.to_numpy()
+        out = base[order]
+        out.setflags(write=False)
+        return out
+    key = repr((version, sort_col, ascending))
+    return get_sort_cache().get_or_load(key, key, build, sizeof=lambda a: a.nbytes)
+
+def page_positions(version: tuple, sort_col: str | None, ascending: bool, df: pd.DataFrame,
+                   idx: np.ndarray | None, start: int, stop: int) -> np.ndarray:
+    # posisi baris satu halaman; tanpa sort cukup slice (tidak ada array seukuran view)
+    if sort_col is not None:
+        return load_sorted_positions(version, sort_col, ascending, df, idx)[start:stop]
+    if idx is None:
+        return np.arange(start, min(stop, len(df)))
+    return np.asarray(idx)[start:stop]
+
+EXPORT_CHUNK_ROWS = 100_000
+
+def iter_view_chunks(df: pd.DataFrame, idx, texts: pd.Series, chunk_rows: int = EXPORT_CHUNK_ROWS):
+    # semua baris view (lengkap dengan text) per potongan -> untuk export penuh
+    pos = np.arange(len(df)) if idx is None else idx
+    for i in range(0, len(pos), chunk_rows):
+        yield fetch_text(df.iloc[pos[i:i + chunk_rows]], texts)
+
+# ============================================================
+# CACHED LOADERS (shared lintas session, key = fingerprint)
+# ============================================================
+@st.cache_data(show_spinner=False, max_entries=2)
+def load_dataset_final(path: Path, fingerprint: tuple | None = None) -> pd.DataFrame:
+    return read_csv_cached(path)
+
+# cache_resource: satu objek dipakai bersama semua session (tanpa copy per rerun),
+# jadi hasilnya read-only -> jangan di-mutate in-place di app.py
+@st.cache_resource(show_spinner=False, max_entries=2)
+def load_standardized_dataset(path: Path, fingerprint: tuple | None) -> tuple[pd.DataFrame, pd.Series | None, dict, str | None]:
+    df, schema, err = standardize_dataset(load_dataset_final(path, fingerprint))
+    if err:
+        return df, None, schema, err
+    df, texts = split_text(df)
+    return df, texts, schema, None
+
+# ============================================================
+# COUNT CUBE (sentimen x rating x topic_id) -> KPI & distribusi tanpa scan baris
+# ============================================================
+CUBE_DIMS = ["sentimen", "rating", "topic_id"]
+
+def build_count_cube(df: pd.DataFrame) -> pd.DataFrame:
+    g = df.groupby(CUBE_DIMS, observed=True)["rating"]
+    cube = pd.DataFrame({"n": g.size(), "rating_sum": g.sum().astype("float64")}).reset_index()
+    return cube
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def load_count_cube(path: Path, fingerprint: tuple | None) -> pd.DataFrame:
+    df, _, _, err = load_standardized_dataset(path, fingerprint)
+    return build_count_cube(df) if not err else pd.DataFrame(columns=CUBE_DIMS + ["n", "rating_sum"])
+
+def merge_cubes(cubes: list[pd.DataFrame], dims: list[str] = CUBE_DIMS) -> pd.DataFrame:
+    # gabung beberapa cube (mis. per chunk upload) -> satu cube
+    if not cubes:
+        return pd.DataFrame(columns=dims + ["n", "rating_sum"])
+    allc = pd.concat(cubes, ignore_index=True)
+    allc["sentimen"] = allc["sentimen"].astype(str)
+    out = allc.groupby(dims)[["n", "rating_sum"]].sum().reset_index()
+    out["sentimen"] = out["sentimen"].astype("category")
+    return out
+
+def cube_slice(cube: pd.DataFrame, rating_filter=None, sent_filter=None) -> pd.DataFrame:
+    m = np.ones(len(cube), dtype=bool)
+    if rating_filter:
+        m &= cube["rating"].isin(rating_filter).to_numpy()
+    if sent_filter:
+        m &= cube["sentimen"].isin(sent_filter).to_numpy()
+    return cube[m]
+
+def cube_kpis(cs: pd.DataFrame) -> dict:
+    total = int(cs["n"].sum())
+    if not total:
+        return {"total": 0, "avg_rating": 0.0, "pos_pct": 0.0, "neg_pct": 0.0}
+    n_by_sent = cs.groupby("sentimen", observed=True)["n"].sum()
+    return {
+        "total": total,
+        "avg_rating": float(cs["rating_sum"].sum() / total),
+        "pos_pct": 100.0 * float(n_by_sent.get("positif", 0)) / total,
+        "neg_pct": 100.0 * float(n_by_sent.get("negatif", 0)) / total,
+    }
+
+def cube_counts(cs: pd.DataFrame, by: str | list[str]) -> pd.DataFrame:
+    # sama dengan df.groupby(by).size().reset_index(name="jumlah")
+    return cs.groupby(by, observed=True)["n"].sum().reset_index(name="jumlah")
+
+PRIORITY_LABELS = {1: "P1 - sangat prioritas", 2: "P2 - prioritas", 3: "P3 - monitoring"}
+
+def cube_priority(cs: pd.DataFrame, sentimen: str = "negatif") -> pd.DataFrame:
+    # tabel prioritas per topic (setara neg_action.csv) langsung dari cube -> ikut filter & data baru.
+    # P1 = frequency >= median DAN mean_rating <= median (sering & impact besar), P2 = salah satu, P3 = tidak keduanya
+    s = cs[cs["sentimen"] == sentimen].sort_values(["topic_id", "rating"])
+    if s.empty:
+        return pd.DataFrame(columns=["topic", "priority", "frequency", "mean_rating", "median_rating"])
+    g = s.groupby("topic_id")
+    freq = g["n"].sum()
+    mean = g["rating_sum"].sum() / freq
+    # median dari distribusi jumlah per rating: nilai di posisi tengah (rata-rata 2 nilai tengah kalau genap)
+    cum = g["n"].cumsum()
+    tot = g["n"].transform("sum")
+    lo = s["rating"][cum > (tot - 1) // 2].groupby(s["topic_id"]).first()
+    hi = s["rating"][cum > tot // 2].groupby(s["topic_id"]).first()
+    out = pd.DataFrame({
+        "frequency": freq.astype(int),
+        "mean_rating": mean.astype("float64"),
+        "median_rating": ((lo + hi) / 2).astype("float64"),
+    })
+    rank = 3 - (out["frequency"] >= out["frequency"].median()).astype(int) \
+             - (out["mean_rating"] <= out["mean_rating"].median()).astype(int)
+    out.insert(0, "priority", rank.map(PRIORITY_LABELS))
+    return out.rename_axis("topic").reset_index()
+
+LABEL_MAP_COLS = ["sentimen", "topic_id", "label", "action"]
+
+def merge_label_map(na: pd.DataFrame, label_map: pd.DataFrame, sentimen: str = "negatif") -> pd.DataFrame | None:
+    # tabel prioritas (kolom topic) + label & action dari topic_label_map.csv; None = format label map tidak sesuai
+    if not set(LABEL_MAP_COLS).issubset(label_map.columns):
+        return None
+    lm = label_map[LABEL_MAP_COLS].assign(
+        sentimen=label_map["sentimen"].astype(str).str.lower().str.strip(),
+        topic_id=pd.to_numeric(label_map["topic_id"], errors="coerce"),
+    ).dropna(subset=["topic_id"])
+    lm = lm[lm["sentimen"] == sentimen].drop(columns="sentimen").astype({"topic_id": int})
+    na = na.assign(topic=pd.to_numeric(na["topic"], errors="coerce")).dropna(subset=["topic"]).astype({"topic": int})
+    return na.merge(lm, left_on="topic", right_on="topic_id", how="left").drop(columns=["topic_id"])
+
+# ============================================================
+# TIME ROLLUP (periode x sentimen x rating x topic_id) -> chart tren tanpa scan baris
+#   - hanya ada kalau dataset punya kolom tanggal (date / at / tanggal)
+#   - harian dibangun dari baris; mingguan & bulanan diturunkan dari rollup harian
+#   - cube_slice / cube_counts / merge_cubes berlaku juga untuk rollup
+# ============================================================
+ROLLUP_FREQS = {"D": "Harian", "W": "Mingguan", "M": "Bulanan"}
+ROLLUP_DIMS = ["periode"] + CUBE_DIMS
+
+def rollups_from_daily(daily: pd.DataFrame) -> dict[str, pd.DataFrame]:
+    out = {"D": daily}
+    for freq in ("W", "M"):
+        periode = daily["periode"].dt.to_period(freq).dt.start_time   # minggu mulai Senin
+        keys = [periode] + [daily[c] for c in CUBE_DIMS]
+        out[freq] = daily.groupby(keys, observed=True)[["n", "rating_sum"]].sum().reset_index()
+    return out
+
+def build_rollups(df: pd.DataFrame) -> dict[str, pd.DataFrame]:
+    if "date" not in df.columns:
+        return {}
+    dated = df[df["date"].notna()]
+    if dated.empty:
+        return {}
+    keys = [dated["date"].dt.floor("D").rename("periode")] + [dated[c] for c in CUBE_DIMS]
+    g = dated.groupby(keys, observed=True)["rating"]
+    daily = pd.DataFrame({"n": g.size(), "rating_sum": g.sum().astype("float64")}).reset_index()
+    return rollups_from_daily(daily)
+
+def merge_rollups(a: dict[str, pd.DataFrame], b: dict[str, pd.DataFrame]) -> dict[str, pd.DataFrame]:
+    # update incremental: biaya ~ jumlah baris rollup, bukan jumlah ulasan
+    if not a or not b:
+        return a or b
+    return {freq: merge_cubes([a[freq], b[freq]], ROLLUP_DIMS) for freq in ROLLUP_FREQS}
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def load_rollups(path: Path, fingerprint: tuple | None) -> dict[str, pd.DataFrame]:
+    df, _, _, err = load_standardized_dataset(path, fingerprint)
+    return build_rollups(df) if not err else {}
+
+# ============================================================
+# FILTER INDEX (posisi baris per kombinasi filter, shared lintas session)
+#   -> df_std tidak pernah di-copy; konsumen baca lewat view_rows(df, idx)
+# ============================================================
+def filter_index(df: pd.DataFrame, rating_filter=None, sent_filter=None) -> np.ndarray:
+    m = np.ones(len(df), dtype=bool)
+    if rating_filter:
+        m &= df["rating"].isin(rating_filter).to_numpy()
+    if sent_filter:
+        m &= df["sentimen"].isin(sent_filter).to_numpy()
+    idx = np.flatnonzero(m)
+    idx.setflags(write=False)   # dipakai bersama semua session
+    return idx
+
+def view_rows(df: pd.DataFrame, idx: np.ndarray | None, n: int | None = None) -> pd.DataFrame:
+    # hanya baris yang benar-benar dibutuhkan yang di-materialize (idx None = semua baris)
+    if idx is None:
+        return df if n is None else df.iloc[:n]
+    return df.iloc[idx if n is None else idx[:n]]
+
+# ============================================================
+# BOUNDED CACHE (registry lintas session)
+#   - invalidasi per key via versi (fingerprint / hash isi)
+#   - LRU eviction dengan budget memori
+# ============================================================
+EXPORT_CACHE_BUDGET_MB = 256
+LOAD_LOCK_STRIPES = 32
+
+def frame_nbytes(df: pd.DataFrame) -> int:
+    return int(df.memory_usage(deep=True).sum())
+
+class BoundedCache:
+    def __init__(self, budget_bytes: int):
+        self.budget_bytes = budget_bytes
+        self._items: OrderedDict[str, tuple[object, object, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        # lock loader di-stripe per hash key: jumlah lock tetap, tidak tumbuh per key (digest upload, ...).
+        # RLock: loader boleh memanggil get_or_load key lain yang kebetulan satu stripe
+        self._load_locks = [threading.RLock() for _ in range(LOAD_LOCK_STRIPES)]
+
+    def _cached(self, key: str, version):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None or item[0] != version:
+                return None
+            self._items.move_to_end(key)
+            return item[1]
+
+    def put_item(self, key: str, version, value, nbytes: int) -> None:
+        with self._lock:
+            self._items[key] = (version, value, nbytes)
+            self._items.move_to_end(key)
+            while len(self._items) > 1 and self.total_bytes() > self.budget_bytes:
+                self._items.popitem(last=False)
+
+    def get_or_load(self, key: str, version, loader, sizeof=frame_nbytes):
+        value = self._cached(key, version)
+        if value is not None:
+            return value
+        key_lock = self._load_locks[hash(key) % len(self._load_locks)]
+        with key_lock:   # satu loader per key: session lain menunggu hasil yang sama
+            value = self._cached(key, version)
+            if value is None:
+                value = loader()
+                self.put_item(key, version, value, sizeof(value))
+        return value
+
+    def total_bytes(self) -> int:
+        return sum(item[2] for item in self._items.values())
+
+class ExportCache(BoundedCache):
+    # data/*.csv kecil (export topic modeling), key = path, versi = fingerprint
+    def put(self, path: Path, fingerprint: tuple, df: pd.DataFrame) -> None:
+        self.put_item(str(path), fingerprint, df, frame_nbytes(df))
+
+    def get(self, path: Path, fingerprint: tuple) -> pd.DataFrame:
+        return self.get_or_load(str(path), fingerprint, lambda: read_csv_cached(path))
+
+@st.cache_resource(show_spinner=False)
+def get_export_cache() -> ExportCache:
+    return ExportCache(EXPORT_CACHE_BUDGET_MB * 1024 * 1024)
+
+@st.cache_resource(show_spinner=False)
+def get_sort_cache() -> BoundedCache:
+    # urutan sort paged_table (lihat load_sorted_positions)
+    return BoundedCache(SORT_CACHE_BUDGET_MB * 1024 * 1024)
+
+# ============================================================
+# INCREMENTAL INGEST (delta ulasan baru di data/incoming/*.csv)
+#   - tiap delta distandardisasi (standardize_dataset), dedup per teks ulasan, lalu jadi segmen sendiri
+#     (SegmentedFrame: dataset_final tidak pernah disalin)
+#   - cube, rollup waktu, filter index & search index di-update dari baris delta saja (biaya ~ ukuran delta)
+#   - compaction: segmen delta digabung jadi satu + snapshot data/.cache/<nama>.<versi>.live.parquet
+#     -> restart cukup baca 1 snapshot + delta yang belum masuk snapshot
+#   - penulis delta: tulis ke nama sementara lalu rename ke *.csv; file baru diterapkan setelah stabil 2x polling
+# ============================================================
+INCOMING_DIR = "incoming"
+COMPACT_MAX_SEGMENTS = 8
+FILTER_INDEX_MAX_ENTRIES = 64
+
+def text_hashes(texts: pd.Series) -> np.ndarray:
+    return pd.util.hash_pandas_object(texts, index=False).to_numpy()
+
+def incoming_files(incoming_dir: Path) -> dict[Path, tuple | None]:
+    return file_fingerprints(sorted(incoming_dir.glob("*.csv")))
+
+def live_snapshot_paths(path: Path, fingerprint: tuple) -> tuple[Path, Path]:
+    _, mtime_ns, size = fingerprint
+    stem = f"{path.name}.{mtime_ns}_{size}.live"
+    return path.parent / SIDECAR_DIR / f"{stem}.parquet", path.parent / SIDECAR_DIR / f"{stem}.json"
+
+def concat_standardized(frames: list[pd.DataFrame]) -> pd.DataFrame:
+    # kategori sentimen tiap frame bisa beda -> disatukan (tetap categorical, bukan object)
+    if any("date" in f.columns for f in frames):   # kolom tanggal opsional -> NaT untuk frame tanpa tanggal
+        frames = [f if "date" in f.columns else f.assign(date=pd.Series(pd.NaT, index=f.index, dtype="datetime64[ns]"))
+                  for f in frames]
+    out = pd.concat(frames)
+    out["sentimen"] = union_categoricals([f["sentimen"].astype("category") for f in frames], sort_categories=True)
+    return out
+
+def conform_columns(df: pd.DataFrame, like: pd.DataFrame) -> pd.DataFrame:
+    # kolom & urutan mengikuti `like` (dataset_final): kolom tambahan dibuang,
+    # kolom opsional yang tidak ada (date, dom_prob) = NA dengan dtype yang sama
+    if list(df.columns) == list(like.columns):
+        return df
+    return pd.DataFrame({
+        c: df[c] if c in df.columns else like[c].iloc[:0].reindex(df.index) for c in like.columns
+    }, index=df.index)
+
+class _SegmentedILoc:
+    def __init__(self, frame: "SegmentedFrame"):
+        self.frame = frame
+
+    def __getitem__(self, pos):
+        return self.frame.take(pos)
+
+class SegmentedFrame:
+    # dataset_final (tidak pernah diubah) + satu frame per segmen delta, tanpa concat.
+    # posisi global = offset segmen + posisi lokal. Subset API DataFrame / Series yang dipakai dashboard:
+    # len(), .columns, [kolom], .iloc[posisi | slice], .reindex(label) (texts)
+    def __init__(self, parts: list):
+        self.parts = parts
+        self.offsets = np.cumsum([0] + [len(p) for p in parts])
+        self.iloc = _SegmentedILoc(self)
+
+    def __len__(self) -> int:
+        return int(self.offsets[-1])
+
+    @property
+    def columns(self) -> pd.Index:
+        return pd.Index(pd.unique(np.concatenate([p.columns.to_numpy() for p in self.parts])))
+
+    def __getitem__(self, col: str) -> "SegmentedFrame":
+        # segmen LiveDataset sudah seragam (conform_columns); kalau tetap ada segmen tanpa kolom tsb,
+        # isi NA dengan dtype kolom dari segmen yang punya (bukan NaT untuk semua tipe)
+        like = next((p[col] for p in self.parts if col in p.columns), None)
+        if like is None:
+            raise KeyError(col)
+        return SegmentedFrame([p[col] if col in p.columns else like.iloc[:0].reindex(p.index) for p in self.parts])
+
+    def _concat(self, pieces: list):
+        if len(pieces) == 1:
+            return pieces[0]
+        return concat_standardized(pieces) if isinstance(pieces[0], pd.DataFrame) else pd.concat(pieces)
+
+    def take(self, pos):
+        # hanya baris yang diminta yang disalin (biaya ~ jumlah posisi, bukan panjang histori)
+        if isinstance(pos, slice):
+            start, stop, _ = pos.indices(len(self))
+            return self._concat([
+                p.iloc[max(start - off, 0):stop - off] for p, off in zip(self.parts, self.offsets)
+                if off < stop and off + len(p) > start
+            ] or [self.parts[0].iloc[:0]])
+        pos = np.asarray(pos, dtype=np.int64)
+        seg = np.searchsorted(self.offsets, pos, side="right") - 1
+        if not len(pos) or seg.min() == seg.max():
+            s = int(seg[0]) if len(pos) else 0
+            return self.parts[s].iloc[pos - self.offsets[s]]
+        order = np.argsort(seg, kind="stable")
+        bounds = np.searchsorted(seg[order], np.arange(len(self.parts) + 1))
+        out = self._concat([
+            p.iloc[pos[order[lo:hi]] - off]
+            for p, off, lo, hi in zip(self.parts, self.offsets, bounds[:-1], bounds[1:]) if hi > lo
+        ])
+        return out.iloc[np.argsort(order)]   # kembalikan ke urutan posisi yang diminta
+
+    def reindex(self, labels) -> pd.Series:
+        # untuk texts: label tiap segmen naik & tidak tumpang tindih (lihat LiveDataset._append)
+        labels = pd.Index(labels)
+        out = pd.Series(None, index=labels, dtype=self.parts[0].dtype, name=self.parts[0].name)
+        for p in self.parts:
+            if len(p):
+                m = np.asarray((labels >= p.index[0]) & (labels <= p.index[-1]))
+                if m.any():
+                    out.iloc[m] = p.reindex(labels[m]).to_numpy()
+        return out
+
+class LiveDataset:
+    # dataset_final (versi = fingerprint) + semua delta incoming/ yang sudah diterapkan.
+    # Baris hanya bertambah di belakang -> posisi baris lama tidak pernah berubah.
+    # Frame dataset_final tidak pernah disalin: tiap delta = segmen sendiri, concat hanya di _compact.
+    def __init__(self, path: Path, fingerprint: tuple):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.incoming_dir = path.parent / INCOMING_DIR
+        df, texts, self.schema, self.err = load_standardized_dataset(path, fingerprint)
+        self._base_rows = len(df)
+        self._base = (df, texts)
+        self._applied: dict[str, tuple] = {}                   # nama file delta -> fingerprint versi terakhir
+        self._rejected: dict[str, tuple[tuple, str]] = {}      # nama file delta -> (fingerprint, error)
+        self._segments: list[tuple[str, int, pd.DataFrame, pd.Series]] = []   # (key, offset, df, texts) per delta
+        self._filters: OrderedDict[tuple, tuple[int, np.ndarray]] = OrderedDict()
+        self._polled: dict[Path, tuple | None] = {}            # fingerprint incoming/ di polling terakhir
+        self._lock = threading.Lock()          # state & filter index (dibaca semua session)
+        self._write_lock = threading.Lock()    # poll / apply / compact (satu penulis)
+        self.dup_rows = 0
+        cube, rollups = load_count_cube(path, fingerprint), load_rollups(path, fingerprint)
+        self._state = (SegmentedFrame([df]), SegmentedFrame([texts]), cube, rollups, (fingerprint, ""))
+        if self.err:
+            return
+        # hash teks terurut: 1 run dataset_final + 1 run per segmen (insert ~ ukuran delta), digabung di _compact
+        self._seen = [np.sort(text_hashes(texts))]
+        self._next_label = int(df.index.max()) + 1 if len(df) else 0
+        with self._write_lock:
+            self._load_snapshot()
+            # delta yang belum masuk snapshot menunggu polling watcher berikutnya (file harus stabil 2x)
+            self._polled = incoming_files(self.incoming_dir)
+
+    def state(self) -> tuple[SegmentedFrame, SegmentedFrame, pd.DataFrame, dict, tuple]:
+        # (df tanpa text, texts, count cube, rollup waktu, versi) -> satu snapshot konsisten per rerun
+        return self._state
+
+    def summary(self) -> dict:
+        with self._lock:
+            return {
+                "files": len(self._applied),
+                "rows": len(self._state[0]) - self._base_rows,
+                "dup_rows": self.dup_rows,
+                "rejected": {name: err for name, (_, err) in self._rejected.items()},
+            }
+
+    def _version(self) -> tuple:
+        if not self._applied:
+            return (self.fingerprint, "")
+        digest = hashlib.blake2b(repr(sorted(self._applied.items())).encode("utf-8"), digest_size=8)
+        return (self.fingerprint, digest.hexdigest())
+
+    def pending(self, files: dict[Path, tuple | None]) -> list[Path]:
+        # per fingerprint, bukan per nama: file yang ditulis ulang dengan nama sama (mis. latest.csv)
+        # diterapkan lagi; baris yang sudah ada terbuang oleh dedup teks
+        return [p for p, fp in files.items()
+                if fp is not None and self._applied.get(p.name) != fp and self._rejected.get(p.name, (None,))[0] != fp]
+
+    def poll(self) -> list[Path]:
+        # delta diterapkan setelah fingerprint-nya sama di 2 polling berturut-turut (hindari file yang masih di-copy)
+        if self.err:
+            return []
+        with self._write_lock:
+            current = incoming_files(self.incoming_dir)
+            ready = [p for p in self.pending(current) if self._polled.get(p) == current[p]]
+            self._polled = current
+            if ready:
+                self._apply(ready)
+        return ready
+
+    def apply(self, paths: list[Path]) -> int:
+        if self.err:
+            return 0
+        with self._write_lock:
+            return self._apply(paths)
+
+    def _apply(self, paths: list[Path]) -> int:
+        added = 0
+        files = file_fingerprints(paths)
+        for p in self.pending(files):
+            fp = files[p]
+            try:
+                std, _, err = standardize_dataset(read_csv_cached(p))
+            except Exception as e:
+                err = str(e)
+            if err:
+                self._rejected[p.name] = (fp, err)   # dicoba lagi hanya kalau file-nya diganti
+                continue
+            self._rejected.pop(p.name, None)
+            added += self._append(f"{self.fingerprint}|{p.name}|{fp[1]}_{fp[2]}", std, {p.name: fp})
+        if len(self._segments) > COMPACT_MAX_SEGMENTS:
+            self._compact()
+        return added
+
+    def _is_seen(self, h: np.ndarray) -> np.ndarray:
+        seen = np.zeros(len(h), dtype=bool)
+        for run in self._seen:
+            if len(run):
+                pos = np.searchsorted(run, h)
+                seen |= run[np.minimum(pos, len(run) - 1)] == h
+        return seen
+
+    def _publish(self, cube: pd.DataFrame, rollups: dict) -> None:
+        # dipanggil dengan self._lock: state baru = list segmen (tanpa menyalin baris)
+        df, texts = self._base
+        self._state = (
+            SegmentedFrame([df] + [s[2] for s in self._segments]),
+            SegmentedFrame([texts] + [s[3] for s in self._segments]),
+            cube, rollups, self._version(),
+        )
+
+    def _append(self, key: str, std: pd.DataFrame, applied: dict[str, tuple]) -> int:
+        _, _, cube, rollups, _ = self._state
+        delta, delta_texts = split_text(std)
+        delta = conform_columns(delta, self._base[0])   # skema tiap segmen = skema dataset_final (export per chunk)
+        h = text_hashes(delta_texts)
+        keep = ~(self._is_seen(h) | pd.Series(h).duplicated().to_numpy())   # vs histori + dalam delta
+        labels = pd.RangeIndex(self._next_label, self._next_label + int(keep.sum()))
+        delta = delta[keep].set_axis(labels)
+        delta_texts = delta_texts[keep].set_axis(labels)
+
+        if len(delta):
+            cube = merge_cubes([cube, build_count_cube(delta)])
+            rollups = merge_rollups(rollups, build_rollups(delta))
+        with self._lock:
+            if len(delta):
+                self._segments.append((key, len(self._state[0]), delta, delta_texts))
+                self._seen.append(np.sort(h[keep]))
+            self._next_label += len(delta)
+            self.dup_rows += int((~keep).sum())
+            self._applied.update(applied)
+            self._publish(cube, rollups)
+        return len(delta)
+
+    def compact(self) -> None:
+        if self.err:
+            return
+        with self._write_lock:
+            self._compact()
+
+    def _compact(self) -> None:
+        # satu-satunya tempat baris delta di-concat: semua segmen -> 1 segmen (dataset_final tetap tidak disalin)
+        _, _, cube, rollups, version = self._state
+        segments = self._segments
+        if not segments:
+            delta = delta_texts = None
+        elif len(segments) == 1:
+            _, _, delta, delta_texts = segments[0]
+        else:
+            delta = concat_standardized([s[2] for s in segments])
+            delta_texts = pd.concat([s[3] for s in segments])
+            with self._lock:
+                self._segments = [(f"{self.fingerprint}|compact|{version[1]}", self._base_rows, delta, delta_texts)]
+                self._seen = [self._seen[0], np.sort(np.concatenate(self._seen[1:]))]
+                self._publish(cube, rollups)
+
+        side, meta = live_snapshot_paths(self.path, self.fingerprint)
+        info = json.dumps({
+            "applied": {name: list(fp) for name, fp in self._applied.items()},
+            "dup_rows": self.dup_rows,
+        })
+        try:
+            meta.unlink(missing_ok=True)   # snapshot lama tidak valid selama parquet diganti
+            if delta is not None:
+                store_sidecar(self.path, side, ".live.parquet",
+                              lambda tmp: fetch_text(delta, delta_texts).to_parquet(tmp, index=False))
+            store_sidecar(self.path, meta, ".live.json", lambda tmp: tmp.write_text(info))   # meta terakhir = penanda lengkap
+        except Exception:
+            pass   # folder read-only -> segmen tetap digabung di memori, snapshot dilewati
+
+    def _load_snapshot(self) -> None:
+        side, meta = live_snapshot_paths(self.path, self.fingerprint)
+        if not (side.exists() and meta.exists()):
+            return
+        try:
+            info = json.loads(meta.read_text())
+            snap = pd.read_parquet(side)
+        except Exception:
+            return   # snapshot rusak -> delta di incoming/ diterapkan ulang satu per satu
+        applied = {name: tuple(fp) for name, fp in info.get("applied", {}).items()}
+        self._append(f"{self.fingerprint}|snapshot|{side.name}", snap, applied)
+        self.dup_rows = int(info.get("dup_rows", 0))
+
+    def view_index(self, df: SegmentedFrame, rating_filter: tuple, sent_filter: tuple) -> np.ndarray:
+        # index per kombinasi filter cukup di-extend dengan baris baru (append-only)
+        key = (rating_filter, sent_filter)
+        with self._lock:
+            n, idx = self._filters.get(key, (0, np.empty(0, dtype=np.intp)))
+        if n > len(df):   # session ini masih memegang versi lebih lama
+            return idx[:np.searchsorted(idx, len(df))]
+        if n < len(df):
+            # mask per segmen (hanya kolom rating/sentimen) -> tidak ada concat baris lintas segmen
+            idx = np.concatenate([idx] + [
+                filter_index(p.iloc[max(n - off, 0):], rating_filter, sent_filter) + max(n, off)
+                for p, off in zip(df.parts, df.offsets) if off + len(p) > n
+            ])
+            idx.setflags(write=False)
+            with self._lock:
+                self._filters[key] = (len(df), idx)
+                self._filters.move_to_end(key)
+                while len(self._filters) > FILTER_INDEX_MAX_ENTRIES:
+                    self._filters.popitem(last=False)
+        return idx
+
+    def clear_view_index(self) -> None:
+        # index filter dibangun ulang dari nol (benchmark: kombinasi filter baru / ter-evict dari LRU)
+        with self._lock:
+            self._filters.clear()
+
+    def search_segments(self) -> tuple[tuple, pd.Series, list[tuple[str, int, pd.Series]]]:
+        # -> (fingerprint dataset_final, texts dataset_final, segmen delta) untuk search index & token counts
+        with self._lock:
+            return self.fingerprint, self._base[1], [(key, offset, texts) for key, offset, _, texts in self._segments]
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def load_live_dataset(path: Path, fingerprint: tuple) -> LiveDataset:
+    return LiveDataset(path, fingerprint)
+
+# ============================================================
+# DATA WATCHER (polling manifest data/ di background thread)
+#   - file berubah -> dibaca ulang di background lalu di-swap ke cache
+#   - manifest baru terlihat oleh session SETELAH data baru siap (tanpa stampede)
+#   - file harus stabil 2x polling dulu (hindari baca file yang masih di-copy)
+#   - delta baru di data/incoming/ di-append ke LiveDataset (tanpa reload penuh)
+# ============================================================
+WATCH_INTERVAL_S = 5.0
+
+class DataWatcher:
+    def __init__(self, paths: list[Path], dataset_path: Path, interval_s: float = WATCH_INTERVAL_S):
+        self.paths = list(paths)
+        self.dataset_path = dataset_path
+        self.interval_s = interval_s
+        self._manifest = file_fingerprints(self.paths)
+        self._pending: dict[Path, tuple | None] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="data-watcher", daemon=True)
+        self._thread.start()
+
+    def manifest(self) -> dict[Path, tuple | None]:
+        with self._lock:
+            return dict(self._manifest)
+
+    def _reload(self, path: Path, fingerprint: tuple) -> None:
+        if path == self.dataset_path:
+            load_live_dataset(path, fingerprint)   # base + semua delta incoming/
+        else:
+            get_export_cache().put(path, fingerprint, read_csv_cached(path))
+
+    def poll(self) -> list[Path]:
+        current = file_fingerprints(self.paths)
+        swapped = []
+        for p, fp in current.items():
+            if fp == self._manifest.get(p):
+                self._pending.pop(p, None)
+                continue
+            if p not in self._pending or self._pending[p] != fp:
+                self._pending[p] = fp   # tunggu polling berikutnya (file masih ditulis?)
+                continue
+            try:
+                if fp is not None:
+                    self._reload(p, fp)
+            except Exception:
+                continue   # gagal baca -> session tetap pakai versi lama, dicoba lagi nanti
+            with self._lock:
+                self._manifest[p] = fp
+            self._pending.pop(p, None)
+            swapped.append(p)
+        return swapped + self.poll_incoming()
+
+    def poll_incoming(self) -> list[Path]:
+        fp = self._manifest.get(self.dataset_path)
+        if fp is None:
+            return []
+        return load_live_dataset(self.dataset_path, fp).poll()
+
+    def _run(self):
+        while not self._stop.wait(self.interval_s):
+            try:
+                self.poll()
+            except Exception:
+                pass
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.interval_s)   # tunggu polling yang sedang jalan selesai
+
+# satu watcher per proses: entry lama keluar dari cache (WATCH_FILES berubah -> max_entries=1,
+# atau "Clear cache" dari menu) -> thread polling-nya dihentikan lewat on_release
+@st.cache_resource(show_spinner=False, max_entries=1, on_release=DataWatcher.stop)
+def start_data_watcher(paths: tuple[Path, ...], dataset_path: Path) -> DataWatcher:
+    return DataWatcher(list(paths), dataset_path)
+
+# ============================================================
+# UPLOAD STREAMING (validasi per chunk, memori tetap terbatas)
+#   - tiap chunk distandardisasi dengan deteksi skema yang sama (standardize_dataset)
+#   - distribusi diakumulasi lewat count cube, yang disimpan hanya sampel baris awal
+# ============================================================
+UPLOAD_CHUNK_ROWS = 50_000
+UPLOAD_SAMPLE_ROWS = 1000   # = batas maksimum slider export subset
+
+def ingest_upload(file, chunksize: int = UPLOAD_CHUNK_ROWS, sample_rows: int = UPLOAD_SAMPLE_ROWS,
+                  on_progress=None, infer_topics=None) -> tuple[pd.DataFrame, pd.DataFrame, dict, str | None]:
+    size = getattr(file, "size", None)
+    if hasattr(file, "seek"):
+        file.seek(0)
+    cubes, samples, n_sample = [], [], 0
+    schema = {}
+    for chunk in pd.read_csv(file, chunksize=chunksize):
+        std, schema, err = standardize_dataset(chunk, infer_topics)
+        if err:
+            return std, merge_cubes([]), schema, err
+        cubes.append(build_count_cube(std))
+        if n_sample < sample_rows:
+            samples.append(std.head(sample_rows - n_sample))
+            n_sample += len(samples[-1])
+        if on_progress is not None and size:
+            on_progress(min(file.tell() / size, 1.0))
+    if not schema:
+        return pd.DataFrame(), merge_cubes([]), schema, "File kosong"
+    sample = pd.concat(samples) if samples else pd.DataFrame()
+    if not sample.empty:
+        sample["sentimen"] = sample["sentimen"].astype(str).astype("category")
+    return sample, merge_cubes(cubes), schema, None
+
+# ============================================================
+# UPLOAD CACHE (hasil ingest_upload per hash isi file, lintas session)
+#   -> upload ulang file yang sama / rerun setelah upload tidak parse ulang
+# ============================================================
+UPLOAD_CACHE_BUDGET_MB = 128
+
+def content_digest(file) -> str:
+    buf = file.getbuffer() if hasattr(file, "getbuffer") else file.getvalue()
+    return hashlib.blake2b(buf, digest_size=16).hexdigest()
+
+def _upload_nbytes(result) -> int:
+    sample, cube, _, _ = result
+    return frame_nbytes(sample) + frame_nbytes(cube)
+
+@st.cache_resource(show_spinner=False)
+def get_upload_cache() -> BoundedCache:
+    return BoundedCache(UPLOAD_CACHE_BUDGET_MB * 1024 * 1024)
+
+def load_upload(file, digest: str, on_progress=None,
+                infer_topics=None) -> tuple[pd.DataFrame, pd.DataFrame, dict, str | None]:
+    # versi = isi file + versi model topik (hasil inferensi ikut berubah kalau top words diganti)
+    version = (digest, getattr(infer_topics, "version", None))
+    return get_upload_cache().get_or_load(
+        digest, version, lambda: ingest_upload(file, on_progress=on_progress, infer_topics=infer_topics),
+        sizeof=_upload_nbytes
+    )
+
+def iter_upload_chunks(data: bytes, chunk_rows: int = EXPORT_CHUNK_ROWS, infer_topics=None):
+    # upload hanya disimpan sebagai sampel -> export penuh distandardisasi ulang per chunk dari bytes
+    for chunk in pd.read_csv(io.BytesIO(data), chunksize=chunk_rows):
+        std, _, err = standardize_dataset(chunk, infer_topics)
+        if err:
+            raise ValueError(err)
+        yield std
+
+# ============================================================
+# EXEMPLAR INDEX (topic -> potongan baris, diurutkan dom_prob)
+#   -> ganti topic / slider "Jumlah contoh" = slice, bukan scan + wrap ulang
+# ============================================================
+EXEMPLAR_WRAP_WIDTH = 115
+
+def wrap_text(s: str, width=110) -> str:
+    return "\n".join(textwrap.wrap(str(s), width=width))
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def load_exemplar_index(fingerprint: tuple, _ex: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame, dict]:
+    # _ex tidak di-hash (key = fingerprint file exemplars)
+    by = ["topic"] + (["dom_prob"] if "dom_prob" in _ex.columns else [])
+    ex = (_ex.dropna(subset=["topic"])
+             .sort_values(by, ascending=[True] + [False] * (len(by) - 1), kind="stable")
+             .reset_index(drop=True))
+
+    disp_cols = (["topic", "rating", "dom_prob", "overlap_topwords", "text"]
+                 if {"dom_prob", "overlap_topwords"}.issubset(ex.columns) else ["topic", "rating", "text"])
+    disp = ex[disp_cols].copy()
+    disp["text"] = disp["text"].map(lambda s: wrap_text(s, EXEMPLAR_WRAP_WIDTH))
+
+    t = ex["topic"].to_numpy()
+    starts = np.flatnonzero(np.r_[True, t[1:] != t[:-1]]) if len(t) else np.empty(0, dtype=int)
+    stops = np.r_[starts[1:], len(t)]
+    spans = {topic: (int(a), int(b)) for topic, a, b in zip(t[starts].tolist(), starts, stops)}
+    return ex, disp, spans
+
+def exemplar_rows(index: tuple, topic, n: int) -> tuple[pd.DataFrame, pd.DataFrame]:
+    # -> (baris asli untuk download, baris dengan text ter-wrap untuk ditampilkan)
+    ex, disp, spans = index
+    start, stop = spans[topic]
+    rows = slice(start, min(stop, start + n))
+    return ex.iloc[rows], disp.iloc[rows]
@@ -0,0 +1,192 @@
+import streamlit as st
+import pandas as pd
+from pathlib import Path
+import gzip
+import hashlib
+import importlib.util
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable
+
+from data_layer import BoundedCache, write_atomic
+from perf import timed
+
+# ============================================================
+# LAZY EXPORTS (payload st.download_button dibuat saat diklik)
+#   - key = (jenis export, versi data, state filter, ...)
+#   - payload kecil di-memo di memori, payload besar di-spool ke disk (tidak memakan budget cache)
+#   - st.download_button butuh isi penuh: payload besar tetap dibaca utuh ke memori per download
+# ============================================================
+PAYLOAD_CACHE_BUDGET_MB = 64
+SPOOL_ROWS = 200_000          # di atas ini CSV ditulis bertahap ke disk, bukan ke bytes
+SPOOL_CHUNK_ROWS = 50_000
+EXPORT_DIR = Path(tempfile.gettempdir()) / "siga_dashboard_exports"
+
+def export_key(*parts) -> str:
+    return hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+@st.cache_resource(show_spinner=False)
+def get_payload_cache() -> BoundedCache:
+    return BoundedCache(PAYLOAD_CACHE_BUDGET_MB * 1024 * 1024)
+
+def _payload_nbytes(payload: bytes | Path) -> int:
+    return len(payload) if isinstance(payload, bytes) else 0
+
+def spool_path(key: str, ext: str) -> Path:
+    return EXPORT_DIR / f"{key}.{ext}"
+
+def render_csv(df: pd.DataFrame, key: str) -> bytes | Path:
+    if len(df) <= SPOOL_ROWS:
+        return df.to_csv(index=False).encode("utf-8")
+    path = spool_path(key, "csv")
+    if not path.exists():
+        write_atomic(path, lambda p: df.to_csv(p, index=False, chunksize=SPOOL_CHUNK_ROWS))
+    return path
+
+def lazy_csv(key: tuple, source) -> Callable[[], bytes]:
+    # source: DataFrame atau callable tanpa argumen yang mengembalikan DataFrame.
+    # Nilai di-bind sekarang (bukan global) karena callable dijalankan di thread lain
+    # setelah rerun berikutnya bisa saja sudah mengganti variabel di app.py.
+    k = export_key("csv", *key)
+
+    def render():
+        with timed(f"download {key[0]}"):
+            return render_csv(source() if callable(source) else source, k)
+
+    def build():
+        payload = get_payload_cache().get_or_load(k, k, render, sizeof=_payload_nbytes)
+        if isinstance(payload, Path) and not payload.exists():   # spool dibersihkan dari /tmp
+            payload = render()
+        # file spool dibaca sekali jadi bytes (handle langsung ditutup); memori ~ ukuran CSV selama download
+        return payload if isinstance(payload, bytes) else payload.read_bytes()
+
+    return build
+
+# ============================================================
+# FULL EXPORT ENGINE (CSV gzip / Parquet / XLSX)
+#   - dibuat di background worker (UI tidak ter-blok)
+#   - hasil disimpan di disk per (versi data, filter, format) -> dipakai ulang semua session
+# ============================================================
+EXPORT_WORKERS = 2
+EXPORT_MAX_FILES = 32
+XLSX_MAX_ROWS = 1_048_575   # batas baris Excel (tanpa header)
+
+FULL_EXPORT_FORMATS = {
+    # label UI -> (ekstensi file, mime)
+    "CSV (gzip)": ("csv.gz", "application/gzip"),
+    "Parquet": ("parquet", "application/octet-stream"),
+    "Excel (XLSX)": ("xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+}
+
+def available_formats() -> list[str]:
+    # XLSX butuh openpyxl (opsional) -> disembunyikan kalau tidak ter-install
+    has_xlsx = importlib.util.find_spec("openpyxl") is not None
+    return [f for f in FULL_EXPORT_FORMATS if f != "Excel (XLSX)" or has_xlsx]
+
+def _export_frame(df: pd.DataFrame) -> pd.DataFrame:
+    # dtype dipatok supaya semua chunk punya skema sama:
+    #   categorical -> string (dictionary per chunk bisa beda), integer -> int64
+    #   (standardize_dataset men-downcast topic_id per chunk; float selalu float32 dari skema ringkas)
+    pinned = {}
+    for c in df.columns:
+        dt = df[c].dtype
+        if isinstance(dt, pd.CategoricalDtype):
+            pinned[c] = str
+        elif pd.api.types.is_integer_dtype(dt) and dt != "int64":
+            pinned[c] = "int64"
+    return df.astype(pinned) if pinned else df
+
+def write_csv_gz(chunks: Iterable[pd.DataFrame], path: Path) -> None:
+    with gzip.open(path, "wb") as f:
+        for i, chunk in enumerate(chunks):
+            f.write(_export_frame(chunk).to_csv(index=False, header=(i == 0)).encode("utf-8"))
+
+def write_parquet(chunks: Iterable[pd.DataFrame], path: Path) -> None:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    writer = None
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(_export_frame(chunk), preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+    if writer is None:
+        raise ValueError("Tidak ada baris untuk di-export.")
+
+def xlsx_too_large(n_rows: int) -> str | None:
+    if n_rows > XLSX_MAX_ROWS:
+        return f"{n_rows:,} baris melebihi batas Excel ({XLSX_MAX_ROWS:,}). Pakai CSV/Parquet."
+    return None
+
+def write_xlsx(chunks: Iterable[pd.DataFrame], path: Path) -> None:
+    # write_only: baris di-stream per chunk (tidak ada concat seluruh view), berhenti begitu lewat batas Excel
+    from openpyxl import Workbook
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    n = 0
+    try:
+        for i, chunk in enumerate(chunks):
+            n += len(chunk)
+            err = xlsx_too_large(n)
+            if err:
+                raise ValueError(err)
+            chunk = _export_frame(chunk)
+            if i == 0:
+                ws.append(list(chunk.columns))
+            for row in chunk.astype(object).where(chunk.notna(), None).itertuples(index=False, name=None):
+                ws.append(row)
+    except BaseException:
+        ws.close()   # tutup stream sheet sementara openpyxl
+        raise
+    wb.save(path)
+
+WRITERS = {"csv.gz": write_csv_gz, "parquet": write_parquet, "xlsx": write_xlsx}
+
+def prune_export_dir(keep: int = EXPORT_MAX_FILES) -> None:
+    files = sorted(EXPORT_DIR.glob("*.*"), key=lambda p: p.stat().st_mtime, reverse=True)
+    for old in files[keep:]:
+        if not old.name.endswith(".tmp"):
+            old.unlink(missing_ok=True)
+
+class ExportJobs:
+    def __init__(self, max_workers: int = EXPORT_WORKERS):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="export")
+        self._jobs: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def _run(self, path: Path, ext: str, chunks: Callable[[], Iterable[pd.DataFrame]]) -> Path:
+        with timed(f"export penuh {ext}"):
+            write_atomic(path, lambda tmp: WRITERS[ext](chunks(), tmp))
+        prune_export_dir()
+        return path
+
+    def submit(self, key: str, ext: str, chunks: Callable[[], Iterable[pd.DataFrame]]) -> None:
+        # chunks: callable tanpa argumen -> iterator DataFrame (dibaca bertahap oleh writer)
+        path = spool_path(key, ext)
+        with self._lock:
+            job = self._jobs.get(key)
+            if path.exists() or (job is not None and not job.done()):
+                return
+            self._jobs[key] = self._pool.submit(self._run, path, ext, chunks)
+
+    def status(self, key: str, ext: str) -> tuple[str, Path | str | None]:
+        # -> ("idle" | "running" | "done" | "error", path / pesan error)
+        path = spool_path(key, ext)
+        with self._lock:
+            job = self._jobs.get(key)
+        if job is not None and not job.done():
+            return "running", None
+        if path.exists():
+            return "done", path
+        if job is not None and job.exception() is not None:
+            return "error", str(job.exception())
+        return "idle", None
+
+@st.cache_resource(show_spinner=False)
+def get_export_jobs() -> ExportJobs:
+    return ExportJobs()
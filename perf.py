@@ -0,0 +1,83 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# ============================================================
+# PERF TIMING (hot path per rerun)
+#   - timed("nama section"): context manager / decorator, durasi dicatat ke ring buffer
+#   - ring buffer dibagi semua session dalam proses (ukuran tetap, data lama terbuang otomatis)
+#   - ringkasan p50/p95/p99 per section untuk panel admin
+# ============================================================
+PERF_RING_SIZE = 5000
+
+class TimingRing:
+    def __init__(self, maxlen: int = PERF_RING_SIZE):
+        self._buf = deque(maxlen=maxlen)    # (timestamp, user, section, ms)
+        self._lock = threading.Lock()
+        self.version = 0                    # naik tiap record -> key payload CSV
+
+    def record(self, section: str, ms: float, user: str = "") -> None:
+        with self._lock:
+            self._buf.append((time.time(), user, section, ms))
+            self.version += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buf.clear()
+            self.version += 1
+
+    def frame(self) -> pd.DataFrame:
+        with self._lock:
+            rows = list(self._buf)
+        df = pd.DataFrame(rows, columns=["timestamp", "user", "section", "ms"])
+        df["timestamp"] = pd.to_datetime(df["timestamp"], unit="s")
+        return df
+
+    def stats(self) -> pd.DataFrame:
+        # per section: jumlah sampel, p50/p95/p99/max (ms), urut p95 terbesar
+        df = self.frame()
+        cols = ["section", "n", "p50_ms", "p95_ms", "p99_ms", "max_ms", "last_ms"]
+        if df.empty:
+            return pd.DataFrame(columns=cols)
+        rows = []
+        for section, ms in df.groupby("section", sort=False)["ms"]:
+            v = ms.to_numpy()
+            p50, p95, p99 = np.percentile(v, [50, 95, 99])
+            rows.append((section, len(v), p50, p95, p99, v.max(), v[-1]))
+        return pd.DataFrame(rows, columns=cols).sort_values("p95_ms", ascending=False, ignore_index=True)
+
+@st.cache_resource(show_spinner=False)
+def get_timing_ring() -> TimingRing:
+    return TimingRing()
+
+def _current_user() -> str:
+    # payload download bisa dibuat di luar script thread (tanpa session) -> user kosong
+    try:
+        return str(st.session_state.get("username", ""))
+    except Exception:
+        return ""
+
+@contextmanager
+def timed(section: str):
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        get_timing_ring().record(section, (time.perf_counter() - t0) * 1000, _current_user())
+
+class Stopwatch:
+    # section berurutan di level modul app.py: lap(nama) = durasi sejak lap sebelumnya
+    def __init__(self):
+        self.t0 = self.t = time.perf_counter()
+
+    def lap(self, section: str) -> None:
+        now = time.perf_counter()
+        get_timing_ring().record(section, (now - self.t) * 1000, _current_user())
+        self.t = now
+
+    def total(self, section: str) -> None:
+        get_timing_ring().record(section, (time.perf_counter() - self.t0) * 1000, _current_user())
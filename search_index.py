@@ -0,0 +1,119 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+from pathlib import Path
+import re
+
+from data_layer import SIDECAR_DIR, store_sidecar
+
+# ============================================================
+# FULL-TEXT SEARCH (inverted index: token -> posting list posisi baris)
+#   - dibangun sekali per versi data, disimpan di data/.cache/*.search.npz
+#   - query: semua kata harus ada (AND); akhiran * = prefix (mis. "verif*")
+# ============================================================
+TOKEN_PATTERN = r"[0-9a-z_]+"
+QUERY_TOKEN_RE = re.compile(TOKEN_PATTERN + r"\*?")
+
+class SearchIndex:
+    def __init__(self, vocab: np.ndarray, offsets: np.ndarray, postings: np.ndarray, n_docs: int):
+        self.vocab = vocab          # token unik, terurut (untuk searchsorted / prefix)
+        self.offsets = offsets      # postings[offsets[i]:offsets[i+1]] = dokumen untuk vocab[i]
+        self.postings = postings    # posisi baris, terurut per token
+        self.n_docs = n_docs
+
+    @classmethod
+    def build(cls, texts: pd.Series) -> "SearchIndex":
+        tokens = texts.fillna("").astype(str).str.lower().str.findall(TOKEN_PATTERN).reset_index(drop=True)
+        flat = tokens.explode().dropna()
+        pairs = pd.DataFrame({"token": flat.to_numpy(dtype=str), "doc": flat.index.to_numpy(dtype=np.int32)})
+        pairs = pairs.drop_duplicates().sort_values(["token", "doc"], kind="stable")
+        vocab, starts = np.unique(pairs["token"].to_numpy(dtype=str), return_index=True)
+        offsets = np.r_[starts, len(pairs)].astype(np.int64)
+        return cls(vocab, offsets, pairs["doc"].to_numpy(dtype=np.int32), len(texts))
+
+    def save(self, path: Path) -> None:
+        with open(path, "wb") as f:
+            np.savez(f, vocab=self.vocab, offsets=self.offsets, postings=self.postings, n_docs=self.n_docs)
+
+    @classmethod
+    def load(cls, path: Path) -> "SearchIndex":
+        with np.load(path) as z:
+            return cls(z["vocab"], z["offsets"], z["postings"], int(z["n_docs"]))
+
+    def postings_for(self, term: str) -> np.ndarray:
+        if term.endswith("*"):
+            prefix = term[:-1]
+            lo = np.searchsorted(self.vocab, prefix, side="left")
+            hi = np.searchsorted(self.vocab, prefix + "\uffff", side="left")
+            return np.unique(self.postings[self.offsets[lo]:self.offsets[hi]])
+        i = np.searchsorted(self.vocab, term)
+        if i < len(self.vocab) and self.vocab[i] == term:
+            return self.postings[self.offsets[i]:self.offsets[i + 1]]
+        return np.empty(0, dtype=np.int32)
+
+    def search(self, query: str) -> np.ndarray:
+        terms = QUERY_TOKEN_RE.findall(query.lower())
+        if not terms:
+            return np.empty(0, dtype=np.int32)
+        lists = sorted((self.postings_for(t) for t in terms), key=len)   # mulai dari list terpendek
+        hits = lists[0]
+        for other in lists[1:]:
+            if not len(hits):
+                break
+            hits = np.intersect1d(hits, other, assume_unique=True)
+        return hits
+
+def search_index_path(path: Path, fingerprint: tuple) -> Path:
+    _, mtime_ns, size = fingerprint
+    return path.parent / SIDECAR_DIR / f"{path.name}.{mtime_ns}_{size}.search.npz"
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def load_search_index(path: Path, fingerprint: tuple, _texts: pd.Series) -> SearchIndex:
+    # _texts tidak di-hash: versi ditentukan fingerprint file sumber.
+    # Posisi di posting list = posisi baris pada _texts.
+    side = search_index_path(path, fingerprint)
+    if side.exists():
+        try:
+            return SearchIndex.load(side)
+        except Exception:
+            pass   # file index rusak -> bangun ulang
+    index = SearchIndex.build(_texts)
+    try:
+        store_sidecar(path, side, ".search.npz", index.save)
+    except Exception:
+        pass   # folder read-only -> index tetap dipakai dari memori
+    return index
+
+# delta data/incoming/ kecil -> index per segmen cukup di memori (key = segmen LiveDataset)
+@st.cache_resource(show_spinner=False, max_entries=32)
+def load_segment_index(key: str, _texts: pd.Series) -> SearchIndex:
+    return SearchIndex.build(_texts)
+
+class SegmentedIndex:
+    # index dataset_final + index per segmen delta; hasil = posisi global (offset segmen)
+    def __init__(self, parts: list[tuple[int, SearchIndex]]):
+        self.parts = parts
+
+    def search(self, query: str) -> np.ndarray:
+        hits = [index.search(query).astype(np.int64) + offset for offset, index in self.parts]
+        return np.concatenate(hits) if hits else np.empty(0, dtype=np.int64)
+
+def live_search_index(path: Path, live) -> SegmentedIndex:
+    fingerprint, base_texts, segments = live.search_segments()
+    parts = [(0, load_search_index(path, fingerprint, base_texts))]
+    parts += [(offset, load_segment_index(key, texts)) for key, offset, texts in segments]
+    return SegmentedIndex(parts)
+
+def filter_hits(hits: np.ndarray, df: pd.DataFrame, rating_filter=None, sent_filter=None,
+                topic_filter=None, topic_col: str = "topic_id") -> np.ndarray:
+    # filter hanya dievaluasi pada baris hasil pencarian, bukan seluruh tabel
+    if not len(hits):
+        return hits
+    m = np.ones(len(hits), dtype=bool)
+    if rating_filter:
+        m &= np.isin(df["rating"].iloc[hits].to_numpy(), rating_filter)
+    if sent_filter:
+        m &= np.isin(df["sentimen"].iloc[hits].astype(str).to_numpy(), sent_filter)
+    if topic_filter:
+        m &= np.isin(df[topic_col].iloc[hits].to_numpy(), topic_filter)
+    return hits[m]
@@ -0,0 +1,65 @@
+import gzip
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_layer import INCOMING_DIR, file_fingerprint, iter_view_chunks, LiveDataset
+from exports import WRITERS
+
+BASE_COLS = ["sentimen", "topic_id", "rating", "dom_prob"]
+
+def review_frame(n: int, tag: str, **extra) -> pd.DataFrame:
+    rng = np.random.default_rng(len(tag))
+    return pd.DataFrame({
+        "sentimen": rng.choice(["positif", "negatif"], size=n),
+        "topic_id": rng.integers(0, 5, size=n),
+        "rating": rng.integers(1, 6, size=n),
+        "text": [f"ulasan {tag} {i}" for i in range(n)],
+        **extra,
+    })
+
+@pytest.fixture
+def live(tmp_path):
+    # dataset_final tanpa date; delta 1 menambah date, delta 2 tanpa dom_prob
+    path = tmp_path / "dataset_final.csv"
+    review_frame(300, "base", dom_prob=0.5).to_csv(path, index=False)
+    incoming = tmp_path / INCOMING_DIR
+    incoming.mkdir()
+    review_frame(120, "tanggal", dom_prob=0.7, at="2026-10-17 08:00:00").to_csv(incoming / "a.csv", index=False)
+    review_frame(80, "tanpa_prob").to_csv(incoming / "b.csv", index=False)
+    ds = LiveDataset(path, file_fingerprint(path))
+    ds.apply(sorted(incoming.glob("*.csv")))
+    return ds
+
+def read_export(path, ext: str) -> pd.DataFrame:
+    if ext == "csv.gz":
+        with gzip.open(path, "rb") as f:
+            return pd.read_csv(io.BytesIO(f.read()))
+    if ext == "parquet":
+        return pd.read_parquet(path)
+    return pd.read_excel(path)
+
+@pytest.mark.parametrize("ext", list(WRITERS))
+def test_export_base_and_deltas_with_different_columns(live, tmp_path, ext):
+    df, texts, _, _, _ = live.state()
+    assert len(df) == 500 and list(df.columns) == BASE_COLS
+    idx = np.arange(len(df))[::-1]   # chunk melintasi batas segmen
+    target = tmp_path / f"export.{ext}"
+    WRITERS[ext](iter_view_chunks(df, idx, texts, chunk_rows=70), target)
+
+    out = read_export(target, ext)
+    assert list(out.columns) == BASE_COLS + ["text"]
+    assert len(out) == len(df)
+    assert out["text"].tolist() == texts.reindex(df.iloc[idx].index).tolist()
+    assert out["dom_prob"].isna().sum() == 80
+
+def test_delta_rewritten_under_same_name_is_applied_again(live):
+    incoming = live.incoming_dir
+    before = len(live.state()[0])
+    latest = incoming / "a.csv"   # ditulis ulang: 120 baris lama + 30 baris baru
+    pd.concat([pd.read_csv(latest), review_frame(30, "baru", dom_prob=0.9)]).to_csv(latest, index=False)
+    assert live.pending({latest: file_fingerprint(latest)}) == [latest]
+    assert live.apply([latest]) == 30
+    assert len(live.state()[0]) == before + 30 and live.summary()["dup_rows"] == 120
@@ -0,0 +1,173 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+from pathlib import Path
+from scipy import sparse
+
+from data_layer import SIDECAR_DIR, store_sidecar
+from search_index import TOKEN_PATTERN
+
+# ============================================================
+# DOCUMENT-TERM MATRIX (scipy CSR: baris = ulasan, kolom = kata)
+#   - dataset_final: dibangun sekali per versi data, matrix + vocab disimpan di data/.cache/*.dtm.npz
+#   - delta incoming/ kecil -> matrix per segmen cukup di memori (lihat LiveDataset.search_segments)
+#   - statistik per topic / sentimen / filter = jumlah baris subset (sparse), bukan tokenisasi ulang
+#   - top words = c-TF-IDF (frekuensi kata di topic x kekhasan antar topic) x idf dokumen
+#   - overlap_topwords = jumlah top words topic-nya yang muncul di ulasan (seperti kolom di exemplars)
+# ============================================================
+TOP_WORDS_K = 10
+
+class TokenCounts:
+    def __init__(self, vocab: pd.Index, matrix: sparse.csr_matrix):
+        self.vocab = vocab      # kata unik (kolom)
+        self.matrix = matrix    # (n_docs, n_vocab) jumlah kemunculan kata per dokumen
+        self.n_docs = matrix.shape[0]
+
+    @classmethod
+    def build(cls, texts: pd.Series) -> "TokenCounts":
+        tokens = texts.fillna("").astype(str).str.lower().str.findall(TOKEN_PATTERN).reset_index(drop=True)
+        flat = tokens.explode().dropna()
+        term, vocab = pd.factorize(flat.to_numpy())
+        doc = flat.index.to_numpy()
+        matrix = sparse.csr_matrix(
+            (np.ones(len(term), dtype=np.int32), (doc, term)), shape=(len(texts), len(vocab)), dtype=np.int32,
+        )
+        matrix.sum_duplicates()
+        return cls(pd.Index(vocab), matrix)
+
+    def save(self, path: Path) -> None:
+        m = self.matrix
+        with open(path, "wb") as f:
+            np.savez(f, vocab=self.vocab.to_numpy(dtype=str), data=m.data, indices=m.indices, indptr=m.indptr,
+                     shape=np.array(m.shape))
+
+    @classmethod
+    def load(cls, path: Path) -> "TokenCounts":
+        with np.load(path) as z:
+            matrix = sparse.csr_matrix((z["data"], z["indices"], z["indptr"]), shape=tuple(z["shape"]))
+            return cls(pd.Index(z["vocab"]), matrix)
+
+    def class_counts(self, classes: np.ndarray, n_classes: int) -> np.ndarray:
+        # classes[doc] = kode kelas (topic) per dokumen, -1 = tidak dihitung -> (n_classes, n_vocab)
+        rows = np.flatnonzero(classes >= 0)
+        member = sparse.csr_matrix(
+            (np.ones(len(rows)), (classes[rows], rows)), shape=(n_classes, self.n_docs),
+        )
+        return (member @ self.matrix).toarray()
+
+    def doc_freq(self) -> np.ndarray:
+        # jumlah dokumen yang memuat tiap kata (entri CSR per baris sudah unik)
+        return np.bincount(self.matrix.indices, minlength=len(self.vocab))
+
+    def overlap(self, rows: np.ndarray, words: list[str]) -> np.ndarray:
+        # jumlah kata (unik) dari `words` yang muncul di tiap dokumen rows
+        cols = self.vocab.get_indexer(pd.unique(pd.Series(words, dtype=object)))
+        cols = cols[cols >= 0]
+        if not len(rows) or not len(cols):
+            return np.zeros(len(rows), dtype=np.int64)
+        return np.asarray((self.matrix[rows][:, cols] > 0).sum(axis=1)).ravel()
+
+def token_counts_path(path: Path, fingerprint: tuple) -> Path:
+    _, mtime_ns, size = fingerprint
+    return path.parent / SIDECAR_DIR / f"{path.name}.{mtime_ns}_{size}.dtm.npz"
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def load_dataset_token_counts(path: Path, fingerprint: tuple, _texts: pd.Series) -> TokenCounts:
+    # _texts tidak di-hash: versi ditentukan fingerprint file sumber (sama seperti load_search_index)
+    side = token_counts_path(path, fingerprint)
+    if side.exists():
+        try:
+            return TokenCounts.load(side)
+        except Exception:
+            pass   # file matrix rusak -> bangun ulang
+    counts = TokenCounts.build(_texts)
+    try:
+        store_sidecar(path, side, ".dtm.npz", counts.save)
+    except Exception:
+        pass   # folder read-only -> matrix tetap dipakai dari memori
+    return counts
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def load_token_counts(key: str, _texts: pd.Series) -> TokenCounts:
+    # key = identitas segmen delta (versi data); _texts tidak di-hash
+    return TokenCounts.build(_texts)
+
+def live_token_counts(live) -> list[tuple[int, TokenCounts]]:
+    # (offset baris global, matrix) untuk dataset_final + tiap segmen delta
+    fingerprint, base_texts, segments = live.search_segments()
+    parts = [(0, load_dataset_token_counts(live.path, fingerprint, base_texts))]
+    parts += [(offset, load_token_counts(key, texts)) for key, offset, texts in segments]
+    return parts
+
+def ctfidf_top_words(counts: pd.DataFrame, doc_freq: pd.Series, n_docs: int, k: int = TOP_WORDS_K) -> pd.Series:
+    # counts: index = kelas, kolom = kata -> "w1, w2, ..." per kelas.
+    # skor = tf per kelas x idf antar kelas (c-TF-IDF) x idf dokumen (buang kata umum: "aplikasi", "ya", ...)
+    tf = counts.to_numpy(dtype=np.float64)
+    avg_words = tf.sum() / max(len(tf), 1)
+    class_idf = np.log1p(avg_words / np.maximum(tf.sum(axis=0), 1))
+    doc_idf = np.log(n_docs / np.maximum(doc_freq.reindex(counts.columns).to_numpy(dtype=np.float64), 1))
+    score = tf / np.maximum(tf.sum(axis=1, keepdims=True), 1) * class_idf * doc_idf
+    top = np.argsort(-score, axis=1, kind="stable")[:, :k]
+    words = counts.columns.to_numpy()
+    return pd.Series(
+        [", ".join(words[row][score[i, row] > 0]) for i, row in enumerate(top)],
+        index=counts.index,
+    )
+
+def view_topic_rows(df: pd.DataFrame, idx: np.ndarray, sentimen: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # baris view dengan sentimen tsb -> (rows, topic_id unik, kode topic per row)
+    rows = np.asarray(idx)
+    rows = rows[(df["sentimen"].iloc[rows].to_numpy() == sentimen)]
+    topic_ids, codes = np.unique(df["topic_id"].iloc[rows].to_numpy(), return_inverse=True)
+    return rows, topic_ids, codes
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def load_topic_top_words(version: tuple, sentimen: str, _live, _df: pd.DataFrame, _idx: np.ndarray,
+                         k: int = TOP_WORDS_K) -> pd.Series:
+    # version = (versi data, filter) -> top words per topic_id untuk baris view dengan sentimen tsb
+    rows, topic_ids, codes = view_topic_rows(_df, _idx, sentimen)
+    classes = np.full(len(_df), -1, dtype=np.int64)
+    classes[rows] = codes
+
+    parts, freqs, n_docs = [], [], 0
+    for offset, tc in live_token_counts(_live):
+        if offset >= len(_df):
+            break   # segmen lebih baru dari snapshot df yang dipakai session ini
+        seg_classes = classes[offset:offset + tc.n_docs]
+        if len(seg_classes) < tc.n_docs:
+            seg_classes = np.r_[seg_classes, np.full(tc.n_docs - len(seg_classes), -1)]
+        parts.append(pd.DataFrame(tc.class_counts(seg_classes, len(topic_ids)), index=topic_ids, columns=tc.vocab))
+        freqs.append(pd.Series(tc.doc_freq(), index=tc.vocab))
+        n_docs += tc.n_docs
+    if not parts or not len(topic_ids):
+        return pd.Series(dtype=str)
+    if len(parts) == 1:
+        counts, doc_freq = parts[0], freqs[0]
+    else:   # vocab tiap segmen beda -> gabung per kata
+        counts = pd.concat(parts, axis=1).T.groupby(level=0).sum().T
+        doc_freq = pd.concat(freqs).groupby(level=0).sum()
+    return ctfidf_top_words(counts, doc_freq, n_docs, k)
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def load_topic_overlap(version: tuple, sentimen: str, _live, _df: pd.DataFrame, _idx: np.ndarray,
+                       top_words: tuple) -> pd.DataFrame:
+    # version = (versi data, filter, versi top_words); top_words = ((topic_id, "w1, w2, ..."), ...)
+    # -> per topic: docs, rata-rata overlap_topwords, % ulasan dengan >= 1 top word
+    words = {t: [w.strip().lower() for w in str(s).split(",") if w.strip()] for t, s in top_words}
+    rows, topic_ids, codes = view_topic_rows(_df, _idx, sentimen)
+    overlap = np.zeros(len(rows), dtype=np.int64)
+    for offset, tc in live_token_counts(_live):
+        if offset >= len(_df):
+            break
+        in_seg = (rows >= offset) & (rows < offset + tc.n_docs)
+        for code, topic in enumerate(topic_ids):
+            m = in_seg & (codes == code)
+            if m.any() and words.get(topic):
+                overlap[m] = tc.overlap(rows[m] - offset, words[topic])
+    s = pd.DataFrame({"topic": topic_ids[codes], "overlap_topwords": overlap})
+    out = s.groupby("topic").agg(
+        docs=("overlap_topwords", "size"),
+        mean_overlap_topwords=("overlap_topwords", "mean"),
+        pct_with_topword=("overlap_topwords", lambda x: 100.0 * (x > 0).mean()),
+    )
+    return out.reset_index()
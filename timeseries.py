@@ -0,0 +1,95 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+from pathlib import Path
+
+from data_layer import read_csv_cached
+
+# ============================================================
+# DERET WAKTU KB AKTIF (data_clean_monthly + forecast skenario)
+#   - tanggal di-parse & diurutkan sekali per versi file (shared lintas session)
+#   - delta skenario vs Base dihitung sekali saat load, bukan per rerun
+#   - histori panjang di-downsample (LTTB) sebelum dikirim ke browser
+# ============================================================
+TS_DATE_COL = "bulan"
+BASE_SCENARIO = "Base"
+LTTB_MAX_POINTS = 600
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def load_monthly_series(path: Path, fingerprint: tuple | None) -> pd.DataFrame:
+    # read-only (dipakai bersama semua session) -> slice / assign, jangan di-mutate
+    df = read_csv_cached(path)
+    num = {c: pd.to_numeric(df[c], errors="coerce") for c in df.columns if c != TS_DATE_COL}
+    df = pd.DataFrame({TS_DATE_COL: pd.to_datetime(df[TS_DATE_COL], errors="coerce"), **num})
+    return df.dropna(subset=[TS_DATE_COL]).sort_values(TS_DATE_COL, kind="stable").reset_index(drop=True)
+
+def forecast_scenarios(fc: pd.DataFrame) -> list[str]:
+    # kolom skenario = semua kolom nilai selain interval (CI_*) & delta bawaan (Delta_*)
+    return [c for c in fc.columns if c != TS_DATE_COL and not c.startswith(("CI_", "Delta_", "delta_", "pct_"))]
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def load_forecast(path: Path, fingerprint: tuple | None) -> tuple[pd.DataFrame, list[str]]:
+    # -> (forecast + delta_<skenario> & pct_<skenario> vs Base, daftar skenario)
+    fc = load_monthly_series(path, fingerprint)
+    scenarios = forecast_scenarios(fc)
+    if not scenarios:
+        return fc, scenarios
+    base = fc[BASE_SCENARIO if BASE_SCENARIO in scenarios else scenarios[0]]
+    deltas = {}
+    for s in scenarios:
+        deltas[f"delta_{s}"] = fc[s] - base
+        deltas[f"pct_{s}"] = 100.0 * (fc[s] - base) / base
+    return fc.assign(**deltas), scenarios
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def load_scenario_summary(fc_path: Path, fc_fingerprint: tuple | None,
+                          hist_path: Path, hist_fingerprint: tuple | None, value_col: str = "kb_aktif") -> pd.DataFrame:
+    # ringkasan per skenario: rata-rata forecast vs Base & vs rata-rata 12 bulan historis terakhir
+    fc, scenarios = load_forecast(fc_path, fc_fingerprint)
+    hist = load_monthly_series(hist_path, hist_fingerprint)
+    hist_avg = hist[value_col].tail(12).mean() if value_col in hist.columns else np.nan
+    rows = []
+    for s in scenarios:
+        rows.append({
+            "skenario": s,
+            "rata_rata_forecast": fc[s].mean(),
+            "delta_vs_base": fc[f"delta_{s}"].mean(),
+            "delta_vs_base_pct": fc[f"pct_{s}"].mean(),
+            "delta_vs_12bln_terakhir_pct": 100.0 * (fc[s].mean() - hist_avg) / hist_avg,
+            "akhir_periode": fc[s].iloc[-1] if len(fc) else np.nan,
+        })
+    return pd.DataFrame(rows)
+
+def range_slice(df: pd.DataFrame, start, end, date_col: str = TS_DATE_COL) -> pd.DataFrame:
+    # df sudah terurut per tanggal -> binary search, bukan mask seluruh kolom
+    d = df[date_col].to_numpy()
+    lo = np.searchsorted(d, np.datetime64(pd.Timestamp(start)), side="left")
+    hi = np.searchsorted(d, np.datetime64(pd.Timestamp(end)), side="right")
+    return df.iloc[lo:hi]
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    # Largest-Triangle-Three-Buckets: titik pertama & terakhir tetap, sisanya 1 titik per bucket
+    # (titik yang membentuk segitiga terbesar dengan titik terpilih sebelumnya & rata-rata bucket berikutnya)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)   # n_out-2 bucket untuk titik 1..n-2
+    out = np.empty(n_out, dtype=np.intp)
+    out[0], out[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nlo, nhi = hi, (edges[i + 2] if i + 2 < len(edges) else n)
+        avg_x, avg_y = x[nlo:nhi].mean(), y[nlo:nhi].mean()
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(np.argmax(area))
+        out[i + 1] = a
+    return out
+
+def downsample(df: pd.DataFrame, y_col: str, max_points: int = LTTB_MAX_POINTS,
+               date_col: str = TS_DATE_COL) -> pd.DataFrame:
+    s = df[[date_col, y_col]].dropna()
+    if len(s) <= max_points:
+        return s
+    x = s[date_col].to_numpy().astype("datetime64[s]").astype(np.float64)
+    return s.iloc[lttb_indices(x, s[y_col].to_numpy(dtype=np.float64), max_points)]
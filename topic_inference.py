@@ -0,0 +1,89 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+from pathlib import Path
+
+from data_layer import read_csv_cached
+from search_index import TOKEN_PATTERN
+
+# ============================================================
+# TOPIC INFERENCE (upload tanpa topic_id)
+#   - model = bobot kata per topik dari top_words neg_topics.csv / pos_topics.csv
+#     (urutan top word = peringkat; kata yang muncul di banyak topik diberi bobot lebih kecil)
+#   - skor = document-term matrix (sparse, koordinat doc/term) x bobot -> dihitung per batch
+#   - tanpa kata yang cocok sama sekali -> topic_id = UNASSIGNED_TOPIC
+# ============================================================
+UNASSIGNED_TOPIC = -1
+SMOOTHING = 0.05
+
+class TopicModel:
+    def __init__(self, vocab: pd.Index, weights: np.ndarray, topics: np.ndarray):
+        self.vocab = vocab        # kata unik (kolom document-term matrix)
+        self.weights = weights    # (n_vocab, n_topic)
+        self.topics = topics      # topic id per kolom bobot
+
+    @classmethod
+    def from_top_words(cls, topics_df: pd.DataFrame) -> "TopicModel":
+        words = topics_df["top_words"].fillna("").astype(str).str.split(",")
+        pairs = pd.DataFrame({
+            "topic": np.repeat(np.arange(len(topics_df)), words.str.len().to_numpy()),
+            "word": [w.strip().lower() for ws in words for w in ws],
+        })
+        pairs = pairs[pairs["word"] != ""]
+        pairs["rank"] = pairs.groupby("topic").cumcount()
+        pairs = pairs.drop_duplicates(["topic", "word"])
+        n_topic = len(topics_df)
+        spread = pairs.groupby("word")["topic"].transform("size")           # di berapa topik kata muncul
+        pairs["w"] = np.log1p(n_topic / spread) / np.log2(pairs["rank"] + 2)  # peringkat x kekhasan
+
+        vocab = pd.Index(pd.unique(pairs["word"]))
+        weights = np.zeros((len(vocab), n_topic), dtype=np.float64)
+        weights[vocab.get_indexer(pairs["word"]), pairs["topic"].to_numpy()] = pairs["w"].to_numpy()
+        topics = pd.to_numeric(topics_df["topic"], errors="coerce").fillna(-1).astype(int).to_numpy()
+        return cls(vocab, weights, topics)
+
+    def doc_terms(self, texts: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+        # document-term matrix dalam bentuk koordinat (baris dokumen, kolom vocab), satu entri per token
+        tokens = texts.fillna("").astype(str).str.lower().str.findall(TOKEN_PATTERN).reset_index(drop=True)
+        flat = tokens.explode().dropna()
+        term = self.vocab.get_indexer(flat.to_numpy())
+        hit = term >= 0
+        return flat.index.to_numpy()[hit], term[hit]
+
+    def predict(self, texts: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+        # -> (topic_id, dom_prob) per dokumen
+        n, n_topic = len(texts), self.weights.shape[1]
+        if not n_topic:
+            return np.full(n, UNASSIGNED_TOPIC), np.zeros(n, dtype=np.float32)
+        doc, term = self.doc_terms(texts)
+        scores = np.empty((n, n_topic))
+        for k in range(n_topic):
+            scores[:, k] = np.bincount(doc, weights=self.weights[term, k], minlength=n)
+        prob = (scores + SMOOTHING) / (scores + SMOOTHING).sum(axis=1, keepdims=True)
+        best = prob.argmax(axis=1)
+        hit = scores.max(axis=1) > 0
+        topic = np.where(hit, self.topics[best], UNASSIGNED_TOPIC)
+        # tanpa kata yang cocok: dom_prob = 0 (bukan 1/K dari smoothing, supaya tidak terlihat seperti assignment)
+        return topic, np.where(hit, prob[np.arange(n), best], 0.0).astype(np.float32)
+
+class TopicInference:
+    # negatif -> model topik negatif; sentimen lain -> model topik positif
+    def __init__(self, neg: TopicModel, pos: TopicModel, version: tuple):
+        self.neg = neg
+        self.pos = pos
+        self.version = version
+
+    def __call__(self, texts: pd.Series, sentimen: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+        topic = np.full(len(texts), UNASSIGNED_TOPIC)
+        prob = np.zeros(len(texts), dtype=np.float32)
+        is_neg = (sentimen.astype(str) == "negatif").to_numpy()
+        for model, m in ((self.neg, is_neg), (self.pos, ~is_neg)):
+            if m.any():
+                topic[m], prob[m] = model.predict(texts[m])
+        return topic, prob
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def load_topic_inference(neg_path: Path, neg_fingerprint: tuple, pos_path: Path, pos_fingerprint: tuple) -> TopicInference:
+    neg = TopicModel.from_top_words(read_csv_cached(neg_path))
+    pos = TopicModel.from_top_words(read_csv_cached(pos_path))
+    return TopicInference(neg, pos, (neg_fingerprint, pos_fingerprint))